@@ -0,0 +1,82 @@
+'''
+    Benchmark del tiempo de importación de los módulos del proyecto.
+
+    Importa cada módulo en un proceso nuevo (para no reutilizar módulos ya cargados),
+    reporta la mediana de varias repeticiones y verifica que `core` no cargue
+    matplotlib, seaborn, tkinter ni numba. Termina con código 1 si se supera algún límite.
+    Uso en consola (desde la raíz del proyecto):
+        python benchmarks/bench_import.py
+'''
+
+import os  # Librería para manejo de rutas
+import sys  # Librería para manipulación del sistema
+import json  # Librería para leer la salida de los subprocesos
+import argparse  # Librería para leer los argumentos de consola
+import statistics  # Librería para calcular la mediana
+import subprocess  # Librería para ejecutar subprocesos
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Límite de tiempo (segundos) por módulo; `core` debe mantenerse cerca del costo de pandas
+LIMITS = {"core": 1.0, "utils": 3.0}
+
+# Módulos pesados que no deben cargarse al importar `core` (numba se carga recién al usar un núcleo)
+HEAVY = ["matplotlib", "seaborn", "tkinter", "numba"]
+
+SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"time": elapsed, "heavy": heavy}}))
+"""
+
+
+def measureImport(module, repeat):
+    """
+    Mide el tiempo de importación de un módulo en procesos nuevos.
+
+    Args:
+        module (str): Nombre del módulo a importar.
+        repeat (int): Cantidad de repeticiones.
+
+    Returns:
+        tuple: La mediana del tiempo (en segundos), la lista de módulos pesados cargados y el error
+        del proceso (None si la importación fue exitosa; en ese caso el tiempo es None).
+    """
+    times = []
+    heavy = []
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module, heavy=HEAVY)],
+                                 cwd=ROOT, capture_output=True, text=True)
+        if process.returncode != 0:
+            # La importación falló: se devuelve el error del proceso en lugar de interrumpir el benchmark
+            return None, [], process.stderr.strip()
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        times.append(result["time"])
+        heavy = result["heavy"]
+    return statistics.median(times), heavy, None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide el tiempo de importación de los módulos.")
+    parser.add_argument("--repeat", type=int, default=5, help="Cantidad de repeticiones por módulo.")
+    args = parser.parse_args()
+
+    failed = False
+    for module, limit in LIMITS.items():
+        elapsed, heavy, error = measureImport(module, args.repeat)
+        if error is not None:
+            print(f"{module:<8} ERROR al importar:\n{error}")
+            failed = True
+            continue
+        status = "OK" if elapsed <= limit else "LENTO"
+        print(f"{module:<8} {elapsed*1000:8.1f} ms  (límite {limit*1000:.0f} ms)  {status}")
+        if elapsed > limit:
+            failed = True
+        if module == "core" and heavy:
+            print(f"  'core' cargó módulos pesados: {', '.join(heavy)}")
+            failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,106 @@
+'''
+    Benchmark de los núcleos de cómputo de `kernels` frente a las operaciones de pandas que reemplazan.
+
+    Genera columnas sintéticas (con nulos), verifica que cada núcleo devuelva el mismo resultado
+    que la versión de pandas y reporta la mediana de varias repeticiones y la aceleración obtenida.
+    Con numba instalado el tiempo de compilación se reporta aparte. Termina con código 1 si algún
+    resultado no coincide.
+    Uso en consola (desde la raíz del proyecto):
+        python benchmarks/bench_kernels.py --rows 1000000
+'''
+
+import os  # Librería para manejo de rutas
+import sys  # Librería para manipulación del sistema
+import time  # Librería para medir tiempos
+import argparse  # Librería para leer los argumentos de consola
+import statistics  # Librería para calcular la mediana
+import numpy as np  # Librería para operaciones numéricas
+import pandas as pd  # Librería para manipulación de datos
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kernels  # Núcleos de cómputo a medir
+
+
+def measure(func, repeat):
+    """
+    Mide el tiempo de ejecución de una función.
+
+    Args:
+        func (function): Función sin argumentos a medir.
+        repeat (int): Cantidad de repeticiones.
+
+    Returns:
+        tuple: La mediana del tiempo (en segundos) y el resultado de la última ejecución.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def getCases(rows, seed=0):
+    """
+    Construye los casos a comparar: (nombre, función de pandas, función del núcleo, comparación).
+
+    Args:
+        rows (int): Cantidad de filas de las columnas sintéticas.
+        seed (int): Semilla del generador aleatorio.
+
+    Returns:
+        list: Lista de casos.
+    """
+    rng = np.random.default_rng(seed)
+    nulls = rng.random(rows) < 0.05
+    continuous = pd.Series(np.where(nulls, np.nan, rng.normal(50, 10, rows)))
+    discrete = pd.Series(np.where(nulls, np.nan, rng.integers(0, 1000, rows)).astype(float))
+    low, high = continuous.min(), continuous.max()
+    bins = 4096
+    width = (high - low) / bins
+
+    def pandasMoments():
+        return int(continuous.isnull().sum()), int(continuous.count()), continuous.mean(), continuous.var() * (continuous.count() - 1)
+
+    def pandasBins():
+        idx = np.clip(((continuous.dropna().to_numpy() - low) / width).astype(int), 0, bins - 1)
+        return np.bincount(idx, minlength=bins)
+
+    def pandasFrequencies():
+        freqs = discrete.value_counts().sort_index()
+        return freqs.index.to_numpy(), freqs.to_numpy()
+
+    return [
+        ("enteros", lambda: bool(discrete.dropna().apply(lambda x: x.is_integer()).all()),
+         lambda: kernels.isIntegral(discrete.to_numpy()), lambda a, b: a == b),
+        ("nulos y momentos", pandasMoments,
+         lambda: kernels.getNullMoments(continuous.to_numpy()),
+         lambda a, b: a[:2] == b[:2] and np.allclose(a[2:], b[2:], rtol=1e-9)),
+        ("histograma", pandasBins,
+         lambda: kernels.binValues(continuous.to_numpy(), low, width, bins), np.array_equal),
+        ("frecuencias", pandasFrequencies,
+         lambda: kernels.countFrequencies(discrete.to_numpy()),
+         lambda a, b: np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1])),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara los núcleos de cómputo con pandas.")
+    parser.add_argument("--rows", type=int, default=1000000, help="Cantidad de filas de cada columna.")
+    parser.add_argument("--repeat", type=int, default=5, help="Cantidad de repeticiones por caso.")
+    args = parser.parse_args()
+
+    print(f"Backend: {kernels.BACKEND}  ({args.rows} filas)")
+    failed = False
+    for name, reference, kernel, same in getCases(args.rows):
+        # La primera llamada compila el núcleo cuando se usa numba
+        compile_time, _ = measure(kernel, 1)
+        pandas_time, expected = measure(reference, args.repeat)
+        kernel_time, result = measure(kernel, args.repeat)
+        status = "OK" if same(expected, result) else "DIFERENTE"
+        failed = failed or status != "OK"
+        print(f"{name:<18} pandas {pandas_time*1000:9.1f} ms  núcleo {kernel_time*1000:9.1f} ms  "
+              f"x{pandas_time / kernel_time:7.1f}  (primera llamada {compile_time*1000:.1f} ms)  {status}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,654 @@
+'''
+    Funciones de perfilado de datos (lectura, tipos de variables, nulos, estadísticas,
+    valores atípicos y muestreo). Solo dependen de pandas y numpy, por lo que pueden
+    usarse en consola o en servidores sin interfaz gráfica.
+'''
+
+import warnings  # Permite silenciar advertencias de columnas vacías
+import numpy as np  # Importa numpy para operaciones vectorizadas
+import pandas as pd  # Importa pandas para manipulación de datos
+from planner import planExecution, readWithPlan  # Planificador según el límite de memoria
+from kernels import isIntegral, getNullMoments, countFrequencies  # Núcleos compilados (opcionales)
+
+
+def getOption(menu, options):
+    """
+    Muestra un menú y permite seleccionar entre las opciones disponibles, verificando que sea una opción válida.
+
+    Args:
+        menu (str): El menú a mostrar al usuario.
+        options (int): El número de opciones disponibles en el menú.
+
+    Returns:
+        int: La opción seleccionada por el usuario.
+    """
+    option = 0  # Inicializa la variable para almacenar la opción seleccionada
+
+    while (True):  # Bucle infinito hasta que se seleccione una opción válida
+        try:
+            # Solicita al usuario ingresar una opción
+            option = int(input(menu))
+            # Verifica si la opción ingresada es válida
+            if option <= 0 or option > options:
+                # Mensaje de error para opción no válida
+                print("Opción no válida")
+            else:
+                break  # Sale del bucle si la opción es válida
+        except:
+            # Mensaje de error para entrada no válida (no es un número entero)
+            print("Debe ingresar un número entero válido.\n")
+    return option  # Retorna la opción seleccionada
+
+
+def readCSV(path, memory_budget=None):
+    """
+    Recibe la ruta al archivo CSV que se desea analizar y valida que este sea válido para el análisis.
+    Si se indica un límite de memoria, el archivo se lee según la estrategia elegida por planExecution
+    y el plan queda disponible en `X.attrs["plan"]`.
+
+    Args:
+        path (str): La ruta al archivo CSV.
+        memory_budget (str | int): Límite de memoria opcional (p. ej. "512MB").
+
+    Returns:
+        DataFrame o str: Retorna el DataFrame si la lectura es exitosa, de lo contrario, retorna un mensaje de error.
+    """
+    try:
+        if memory_budget is None:
+            # Intenta leer el archivo CSV en un DataFrame
+            X = pd.read_csv(path)
+        else:
+            # Elige cómo leer el archivo para no superar el límite de memoria
+            plan = planExecution(path, memory_budget)
+            X = readWithPlan(path, plan)
+            X.attrs["plan"] = plan
+
+        # Verifica si el DataFrame está vacío
+        if X.empty:
+            return "El archivo CSV está vacío."
+
+        return X  # Retorna el DataFrame si la lectura es exitosa
+
+    except FileNotFoundError:
+        # Retorna un mensaje de error si el archivo no se encuentra en la ruta especificada
+        return f"No se encontró el archivo en la ruta '{path}'."
+    except pd.errors.EmptyDataError:
+        # Retorna un mensaje de error si el archivo CSV está vacío
+        return "El archivo CSV está vacío."
+    except pd.errors.ParserError:
+        # Retorna un mensaje de error si ocurre un problema al analizar el archivo CSV
+        return "Error al analizar el archivo CSV."
+    except ValueError as e:
+        # Retorna el mensaje de error específico si ocurre un ValueError (p. ej. un límite de memoria no válido)
+        return str(e)
+    except Exception as e:
+        # Retorna un mensaje de error genérico para cualquier otra excepción
+        return f"Se produjo un error inesperado: {e}"
+
+
+def identifyVariables(dataset):
+    """
+    Identifica las variables del DataFrame X como:
+        - Categóricas
+        - Numéricas Continuas
+        - Numéricas Discretas
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+
+    Returns:
+        list: Una lista de tres listas que contienen los nombres de las columnas categóricas, continuas y discretas.
+    """
+    columnas_continuas = []  # Lista para almacenar las columnas numéricas continuas
+    columnas_discretas = []  # Lista para almacenar las columnas numéricas discretas
+    columnas_categoricas = []  # Lista para almacenar las columnas categóricas
+
+    # Itera sobre cada columna del DataFrame (se convierte una columna a la vez, sin copiar el DataFrame)
+    for column in dataset.columns:
+        try:
+            # Intenta convertir la columna a valores numéricos
+            values = pd.to_numeric(dataset[column], errors='coerce')
+        except:
+            # Si falla, se considera una columna categórica
+            columnas_categoricas.append(column)
+            continue
+
+        # Cuenta el número de valores únicos en la columna
+        num_unique = values.nunique()
+
+        if num_unique <= 2:
+            # Si hay 2 o menos valores únicos, se considera categórica
+            columnas_categoricas.append(column)
+        elif isIntegral(values.to_numpy()):
+            # Si todos los valores son enteros, se considera discreta
+            columnas_discretas.append(column)
+        else:
+            # De lo contrario, se considera continua
+            columnas_continuas.append(column)
+
+    # Retorna las listas de columnas categóricas, continuas y discretas
+    return [columnas_categoricas, columnas_continuas, columnas_discretas]
+
+
+def getNulls(X):
+    
+    """
+    Para un DataFrame dado, identifica las variables en las que existan valores nulos y cuántos hay.
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+
+    Returns:
+        list: Una lista de tuplas de la forma (variable, cantidad_nulos, porcentaje_nulos).
+    """
+    # Cuenta los nulos de todas las columnas una sola vez
+    counts = X.isnull().sum()
+    # Crea una lista de tuplas con el nombre de la columna, la cantidad de nulos y el porcentaje de nulos
+    nulls = [(col, counts[col], counts[col] / X.shape[0]) for col in X.columns]
+    # Filtra las columnas que tienen al menos un valor nulo
+    # nulls = [n for n in nulls if n[1] > 0]
+    nulls = {col: [count, percentage] for col, count, percentage in nulls if count > 0}
+    return nulls  # Retorna el diccionario
+
+
+def getStatistics(X, numerics):
+    """
+    Muestra las estadísticas descriptivas para cada variable numérica en el dataframe X.
+    Devuelve un diccionario de la forma: 
+    { var: (media, mediana, moda, desviación estándar) }
+    para cada variable.
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+        numerics (list): Lista de nombres de columnas numéricas.
+
+    Returns:
+        dict: Diccionario con estadísticas descriptivas para cada variable numérica.
+    """
+    statistics = {}  # Diccionario para almacenar las estadísticas
+
+    # Itera sobre cada columna numérica
+    for col in numerics:
+        # Intentar convertir la columna a valores numéricos, forzando a NaN los valores no convertibles.
+        # Las columnas ya numéricas no se reasignan: hacerlo copia el bloque completo del DataFrame
+        if not pd.api.types.is_numeric_dtype(X[col]):
+            X[col] = pd.to_numeric(X[col], errors='coerce')
+
+        values = X[col].to_numpy()
+        if values.dtype.kind not in "iuf":
+            values = X[col].to_numpy(dtype=float, na_value=np.nan)
+
+        # Un recorrido acumula nulos, cantidad, media y suma de cuadrados
+        _, n, mean, m2 = getNullMoments(values)
+
+        # Calcula estadísticas si la columna no está vacía
+        if n > 0:
+            std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan  # Calcula la desviación estándar
+
+            # Las frecuencias (en orden ascendente) dan la moda y la mediana sin otro ordenamiento
+            uniques, freqs = countFrequencies(values)
+            mode = uniques[np.argmax(freqs)]  # Igual que Series.mode(): el menor de los más frecuentes
+            cumulative = np.cumsum(freqs)
+            middle = np.searchsorted(cumulative, [(n - 1) // 2, n // 2], side='right')
+            median = (float(uniques[middle[0]]) + float(uniques[middle[1]])) / 2  # Calcula la mediana
+
+            # Almacena las estadísticas en el diccionario
+            statistics[col] = (mean, median, mode, std)
+        else:
+            statistics[col] = (None, None, None, None)
+
+    return statistics  # Retorna el diccionario con las estadísticas
+
+
+def getNumericMatrix(X, numerics, rows=None):
+    """
+    Convierte las columnas numéricas en una matriz de flotantes (NaN para valores no convertibles),
+    llenándola columna por columna para no crear copias intermedias del DataFrame.
+
+    Args:
+        X (DataFrame): El DataFrame con los datos.
+        numerics (list): Lista de nombres de columnas numéricas.
+        rows (ndarray): Posiciones opcionales de las filas a tomar (en ese orden).
+
+    Returns:
+        ndarray: Matriz de forma (filas, columnas).
+    """
+    M = np.empty((X.shape[0] if rows is None else len(rows), len(numerics)))
+    for j, col in enumerate(numerics):
+        values = pd.to_numeric(X[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        M[:, j] = values if rows is None else values[rows]
+    return M
+
+
+def getOutliers(X, numerics, iqr_factor=1.5, z_threshold=3.0, mad_threshold=3.5):
+    """
+    Detecta los valores atípicos de todas las variables numéricas en una sola pasada vectorizada.
+    Se aplican tres criterios sobre la matriz completa de columnas numéricas:
+        - Cercas IQR: valores fuera de [Q1 - k*IQR, Q3 + k*IQR]
+        - Puntaje z: |x - media| / desviación estándar mayor al umbral
+        - Puntaje z robusto (MAD): 0.6745 * |x - mediana| / MAD mayor al umbral
+          (si MAD es 0, |x - mediana| / (1.2533 * desviación absoluta media))
+    Además se calculan las estadísticas de caja (formato de `Axes.bxp`) para cada variable.
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+        numerics (list): Lista de nombres de columnas numéricas.
+        iqr_factor (float): Factor k para las cercas IQR.
+        z_threshold (float): Umbral para el puntaje z.
+        mad_threshold (float): Umbral para el puntaje z robusto.
+
+    Returns:
+        dict: Diccionario de la forma:
+        { var: {"iqr": (cantidad, indices), "zscore": (cantidad, indices), "mad": (cantidad, indices),
+                "validos": cantidad_no_nulos, "tasa": proporcion_atipicos_iqr, "caja": estadisticas_bxp} }
+    """
+    # Convierte todas las columnas numéricas a una matriz de flotantes (NaN para no convertibles)
+    M = getNumericMatrix(X, numerics)
+    valid = ~np.isnan(M)
+    counts = valid.sum(axis=0)
+
+    with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+        # Las columnas completamente nulas generan advertencias de "All-NaN slice"
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+
+        # Cuartiles y cercas IQR de todas las columnas a la vez
+        q1, median, q3 = np.nanpercentile(M, [25, 50, 75], axis=0)
+        iqr = q3 - q1
+        low = q1 - iqr_factor * iqr
+        high = q3 + iqr_factor * iqr
+        iqr_mask = (M < low) | (M > high)
+
+        # Los cálculos intermedios reutilizan una sola matriz auxiliar para no multiplicar la memoria
+        scratch = np.empty_like(M)
+
+        # Puntaje z clásico (media y desviación calculadas sobre la matriz auxiliar, con los nulos en 0)
+        np.copyto(scratch, M)
+        scratch[~valid] = 0
+        mean = scratch.sum(axis=0) / counts
+        np.subtract(M, mean, out=scratch)
+        scratch[~valid] = 0
+        std = np.sqrt(np.square(scratch, out=scratch).sum(axis=0) / (counts - 1))
+        np.abs(np.subtract(M, mean, out=scratch), out=scratch)
+        z_mask = scratch > z_threshold * std
+
+        # Puntaje z robusto basado en la desviación absoluta mediana. Si MAD es 0 (más de la mitad
+        # de los valores son iguales) se usa la desviación absoluta media: |x - mediana| / (1.2533 * MeanAD)
+        np.abs(np.subtract(M, median, out=scratch), out=scratch)
+        mad = np.nanmedian(scratch, axis=0)
+        mean_ad = np.nansum(scratch, axis=0) / counts
+        scale = np.where(mad > 0, mad / 0.6745, 1.2533 * mean_ad)
+        mad_mask = scratch > mad_threshold * scale
+
+        # Extremos de los bigotes: valores más lejanos dentro de las cercas
+        np.copyto(scratch, M)
+        scratch[M < low] = np.nan
+        whislo = np.nanmin(scratch, axis=0)
+        np.copyto(scratch, M)
+        scratch[M > high] = np.nan
+        whishi = np.nanmax(scratch, axis=0)
+        del scratch
+
+    outliers = {}  # Diccionario para almacenar los resultados
+
+    # Solo el armado del resultado recorre las columnas
+    for j, col in enumerate(numerics):
+        if counts[j] == 0:
+            outliers[col] = {"iqr": (0, []), "zscore": (0, []), "mad": (0, []),
+                             "validos": 0, "tasa": 0.0, "caja": None}
+            continue
+
+        iqr_idx = X.index[iqr_mask[:, j]]
+        outliers[col] = {
+            "iqr": (len(iqr_idx), list(iqr_idx)),
+            "zscore": (int(z_mask[:, j].sum()), list(X.index[z_mask[:, j]])),
+            "mad": (int(mad_mask[:, j].sum()), list(X.index[mad_mask[:, j]])),
+            "validos": int(counts[j]),
+            "tasa": len(iqr_idx) / counts[j],
+            "caja": {
+                "label": col,
+                "mean": mean[j],
+                "med": median[j],
+                "q1": q1[j],
+                "q3": q3[j],
+                "whislo": whislo[j],
+                "whishi": whishi[j],
+                "fliers": M[iqr_mask[:, j], j],
+            },
+        }
+
+    return outliers  # Retorna el diccionario con los valores atípicos
+
+
+def rankOutliers(outliers, method="iqr"):
+    """
+    Ordena las variables de mayor a menor según su tasa de valores atípicos.
+
+    Args:
+        outliers (dict): Resultado de getOutliers.
+        method (str): Criterio a utilizar (iqr | zscore | mad).
+
+    Returns:
+        list: Una lista de tuplas de la forma (variable, cantidad_atipicos, tasa_atipicos).
+    """
+    ranking = []
+    for col, result in outliers.items():
+        count = result[method][0]
+        rate = count / result["validos"] if result["validos"] > 0 else 0.0
+        ranking.append((col, count, rate))
+
+    # Ordena por tasa descendente
+    ranking.sort(key=lambda r: r[2], reverse=True)
+    return ranking
+
+def getAssociation(X, var1, var2, categorical):
+    """
+    Mide la asociación entre dos variables según su tipo:
+        - Numérica y numérica: correlación de Pearson y de Spearman.
+        - Categórica y categórica: V de Cramér a partir de la tabla de contingencia.
+        - Categórica y numérica: razón de correlación (eta).
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+        var1 (str): El nombre de la primera variable.
+        var2 (str): El nombre de la segunda variable.
+        categorical (list): Lista de nombres de columnas categóricas.
+
+    Returns:
+        dict: Diccionario con el nombre de cada medida y su valor, más la cantidad de filas usadas.
+    """
+    cat1, cat2 = var1 in categorical, var2 in categorical
+    pair = X[[var1, var2]].copy()
+    if not cat1:
+        pair[var1] = pd.to_numeric(pair[var1], errors='coerce')
+    if not cat2:
+        pair[var2] = pd.to_numeric(pair[var2], errors='coerce')
+    pair = pair.dropna()
+
+    association = {"filas": len(pair)}
+    if len(pair) < 2:
+        return association
+
+    if not cat1 and not cat2:
+        association["pearson"] = pair[var1].corr(pair[var2])
+        # Spearman como Pearson sobre los rangos, sin depender de scipy
+        association["spearman"] = pair[var1].rank().corr(pair[var2].rank())
+
+    elif cat1 and cat2:
+        table = pd.crosstab(pair[var1], pair[var2]).to_numpy(dtype=float)
+        expected = table.sum(axis=1, keepdims=True) * table.sum(axis=0, keepdims=True) / table.sum()
+        chi2 = ((table - expected) ** 2 / expected).sum()
+        k = min(table.shape) - 1
+        association["chi2"] = chi2
+        association["cramer_v"] = np.sqrt(chi2 / (table.sum() * k)) if k > 0 else np.nan
+
+    else:
+        cat, num = (var1, var2) if cat1 else (var2, var1)
+        # Varianza entre grupos sobre la varianza total
+        groups = pair.groupby(cat, observed=True)[num].agg(['count', 'mean'])
+        total = ((pair[num] - pair[num].mean()) ** 2).sum()
+        between = (groups['count'] * (groups['mean'] - pair[num].mean()) ** 2).sum()
+        association["eta"] = np.sqrt(between / total) if total > 0 else np.nan
+
+    return association
+
+
+def getGroupedStatistics(X, target, numerics, bins=64, iqr_factor=1.5, density=False):
+    """
+    Calcula, para cada categoría de la variable objetivo, las estadísticas de todas las variables numéricas.
+    La variable objetivo se factoriza una sola vez y las filas se ordenan por grupo, de modo que cada
+    estadística se obtiene con una operación vectorizada sobre todos los grupos y columnas.
+    Además se guardan las estadísticas de caja (formato de `Axes.bxp`) y, si se solicita, una densidad
+    suavizada (formato de `Axes.violin`) para graficar sin volver a recorrer los datos.
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+        target (str): Nombre de la variable categórica objetivo (p. ej. "Biopsy").
+        numerics (list): Lista de nombres de columnas numéricas.
+        bins (int): Cantidad de intervalos de la densidad.
+        iqr_factor (float): Factor k para las cercas IQR de los bigotes.
+        density (bool): Si es True, calcula la densidad suavizada de cada grupo (solo la usan los gráficos de violín).
+
+    Returns:
+        dict: Diccionario de la forma:
+        { var: { categoria: {"cantidad", "media", "desviacion", "minimo", "q1", "mediana", "q3", "maximo",
+                              "nulos", "tasa_nulos", "caja": estadisticas_bxp, "densidad": estadisticas_violin} } }
+    """
+    # Factoriza la variable objetivo una sola vez; las filas con objetivo nulo se descartan
+    codes, labels = pd.factorize(X[target], sort=True)
+    if len(numerics) == 0 or len(labels) == 0:
+        # Sin columnas numéricas o con la variable objetivo completamente nula no hay grupos que resumir
+        return {col: {} for col in numerics}
+    valid = codes >= 0
+    order = np.argsort(codes[valid], kind='stable')
+    codes = codes[valid][order]
+    M = getNumericMatrix(X, numerics, np.flatnonzero(valid)[order])
+
+    # Inicio de cada grupo en las filas ordenadas (todas las categorías tienen al menos una fila)
+    groups = len(labels)
+    starts = np.searchsorted(codes, np.arange(groups))
+    ends = np.append(starts[1:], len(codes))
+    sizes = ends - starts
+
+    with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+
+        # Conteos, medias y desviaciones de todos los grupos y columnas a la vez: matrices (grupos, columnas)
+        present = ~np.isnan(M)
+        counts = np.add.reduceat(present, starts, axis=0)
+        means = np.add.reduceat(np.where(present, M, 0), starts, axis=0) / counts
+        squares = np.add.reduceat(np.where(present, (M - means[codes]) ** 2, 0), starts, axis=0)
+        stds = np.sqrt(squares / (counts - 1))
+
+        # Cuantiles: un cálculo por grupo sobre todas las columnas
+        quantiles = np.stack([np.nanpercentile(M[s:e], [0, 25, 50, 75, 100], axis=0)
+                              for s, e in zip(starts, ends)], axis=1)  # (5, grupos, columnas)
+        low_q, q1, median, q3, high_q = quantiles
+
+        # Bigotes: valores más lejanos dentro de las cercas IQR de cada grupo
+        low = (q1 - iqr_factor * (q3 - q1))[codes]
+        high = (q3 + iqr_factor * (q3 - q1))[codes]
+        inside = (M >= low) & (M <= high)
+        whislo = np.minimum.reduceat(np.where(inside, M, np.inf), starts, axis=0)
+        whishi = np.maximum.reduceat(np.where(inside, M, -np.inf), starts, axis=0)
+        outside = present & ~inside
+
+        # Cada grupo tiene sus propios intervalos: su rango extendido 3 anchos de banda por lado
+        # (como el parámetro cut de seaborn), para que la densidad suavizada no pierda masa en los bordes
+        bandwidth = np.nan_to_num(stds * counts ** (-1 / 5))
+        lo = low_q - 3 * bandwidth
+        width = np.where(high_q > low_q, (high_q + 3 * bandwidth - lo) / bins, 1.0)
+
+    grouped = {}  # Diccionario para almacenar los resultados
+    for j, col in enumerate(numerics):
+        grouped[col] = {}
+
+        if density and present[:, j].any():
+            # Un solo bincount por columna cuenta las filas de cada (grupo, intervalo del grupo)
+            p = present[:, j]
+            idx = np.clip(((M[p, j] - lo[codes[p], j]) / width[codes[p], j]).astype(int), 0, bins - 1)
+            hist = np.bincount(codes[p] * bins + idx, minlength=groups * bins).reshape(groups, bins)
+
+        for g, label in enumerate(labels):
+            n = int(counts[g, j])
+            result = {"cantidad": n, "nulos": int(sizes[g] - n), "tasa_nulos": (sizes[g] - n) / sizes[g],
+                      "media": None, "desviacion": None, "minimo": None, "q1": None, "mediana": None,
+                      "q3": None, "maximo": None, "caja": None, "densidad": None}
+            if n > 0:
+                result.update({"media": means[g, j], "desviacion": stds[g, j], "minimo": low_q[g, j],
+                               "q1": q1[g, j], "mediana": median[g, j], "q3": q3[g, j], "maximo": high_q[g, j]})
+                result["caja"] = {"label": label, "mean": means[g, j], "med": median[g, j],
+                                  "q1": q1[g, j], "q3": q3[g, j], "whislo": whislo[g, j], "whishi": whishi[g, j],
+                                  "fliers": M[starts[g]:ends[g], j][outside[starts[g]:ends[g], j]]}
+                if density:
+                    coords = lo[g, j] + (np.arange(bins) + 0.5) * width[g, j]
+                    result["densidad"] = getSmoothedDensity(hist[g], coords, width[g, j], n, stds[g, j],
+                                                            means[g, j], median[g, j], low_q[g, j], high_q[g, j])
+            grouped[col][label] = result
+
+    return grouped
+
+
+def getSmoothedDensity(hist, coords, width, n, std, mean, median, minimum, maximum):
+    """
+    Convierte el histograma de un grupo en una densidad suavizada con un núcleo gaussiano
+    (ancho de banda de Scott), en el formato que recibe `Axes.violin`.
+
+    Args:
+        hist (ndarray): Conteos del grupo en cada intervalo (calculados sobre el rango del propio grupo).
+        coords (ndarray): Centro de cada intervalo.
+        width (float): Ancho de los intervalos.
+        n (int): Cantidad de valores no nulos del grupo.
+        std (float): Desviación estándar del grupo.
+        mean, median, minimum, maximum (float): Estadísticas del grupo.
+
+    Returns:
+        dict: Diccionario con las claves coords, vals, mean, median, min y max.
+    """
+    bins = len(hist)
+    bandwidth = std * n ** (-1 / 5) / width if n > 1 and std > 0 else 0
+    if bandwidth > 0:
+        # El núcleo se normaliza completo y luego se recorta a bins - 1 intervalos por lado:
+        # más allá no alcanza ningún intervalo (en grupos pequeños y dispersos puede ser muy ancho)
+        half = int(np.ceil(3 * bandwidth))
+        norm = np.exp(-0.5 * (np.arange(-half, half + 1) / bandwidth) ** 2).sum()
+        half = min(half, bins - 1)
+        kernel = np.exp(-0.5 * (np.arange(-half, half + 1) / bandwidth) ** 2) / norm
+        # Convolución completa y se toma el tramo centrado de largo bins
+        vals = np.convolve(hist, kernel, mode='full')[half:half + bins]
+    else:
+        vals = hist.astype(float)
+
+    return {"coords": coords, "vals": vals / (n * width),
+            "mean": mean, "median": median, "min": minimum, "max": maximum}
+
+
+def getSamplePrefix(total, size, seed=0):
+    """
+    Elige al azar las posiciones de la primera muestra sin recorrer todas las filas
+    (el costo depende de `size`, no del total).
+
+    Args:
+        total (int): Cantidad total de filas.
+        size (int): Cantidad de filas de la muestra.
+        seed (int): Semilla del generador aleatorio.
+
+    Returns:
+        ndarray: Posiciones de las filas elegidas (a lo sumo `total`).
+    """
+    return np.random.default_rng(seed).choice(total, min(size, total), replace=False)
+
+
+def getSampleOrder(X, seed=0, stratify=None, prefix=None):
+    """
+    Genera un orden aleatorio de las filas del DataFrame. Las muestras tomadas con el mismo
+    orden están anidadas: cada muestra más grande contiene a las anteriores.
+    Si se indica `stratify`, cualquier tramo inicial del orden conserva la proporción de cada
+    categoría de esa columna: la k-ésima fila de una categoría con n filas tiene prioridad
+    (k + 0.5) / n y el orden las recorre de menor a mayor prioridad.
+
+    Args:
+        X (DataFrame): El DataFrame a muestrear.
+        seed (int): Semilla del generador aleatorio.
+        stratify (str): Nombre de la columna por la cual estratificar.
+        prefix (ndarray): Posiciones de una muestra ya tomada (ver getSamplePrefix); quedan al inicio
+            del orden para que las muestras siguientes la contengan.
+
+    Returns:
+        ndarray: Permutación de las posiciones de las filas.
+    """
+    rng = np.random.default_rng(seed)
+    total = X.shape[0]
+    if prefix is None:
+        order = rng.permutation(total)
+    else:
+        rest = np.ones(total, dtype=bool)
+        rest[prefix] = False
+        rest = np.flatnonzero(rest)
+        order = np.concatenate([prefix, rest[rng.permutation(len(rest))]])
+
+    if stratify is None:
+        return order
+
+    codes = pd.factorize(X[stratify])[0][order] + 1  # Los nulos (-1) pasan a la categoría 0
+    rank = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+    priority = (rank + 0.5) / np.bincount(codes)[codes]
+    if prefix is not None:
+        priority[:len(prefix)] = -1  # La muestra ya tomada va primero
+    return order[np.argsort(priority, kind='stable')]
+
+
+def getSampleSizes(total, first=2000, factor=4):
+    """
+    Devuelve los tamaños de muestra sucesivos para graficar de forma progresiva,
+    desde una muestra inicial pequeña hasta el total de filas.
+
+    Args:
+        total (int): Cantidad total de filas.
+        first (int): Tamaño de la primera muestra.
+        factor (int): Factor de crecimiento entre muestras consecutivas.
+
+    Returns:
+        list: Lista creciente de tamaños de muestra, terminando en el total.
+    """
+    sizes = []
+    size = first
+    while size < total:
+        sizes.append(size)
+        size *= factor
+    sizes.append(total)
+    return sizes
+
+
+def getSample(X, size, order=None, stratify=None):
+    """
+    Devuelve una muestra de `size` filas del DataFrame: las primeras `size` posiciones del orden.
+    Si se indica `stratify`, la muestra conserva la proporción de cada categoría de esa columna
+    (con una diferencia menor a una fila por categoría); las categorías muy pequeñas pueden quedar fuera.
+
+    Args:
+        X (DataFrame): El DataFrame a muestrear.
+        size (int): Cantidad de filas deseadas.
+        order (ndarray): Orden de las filas (ver getSampleOrder); si ya está estratificado no se indica `stratify`.
+        stratify (str): Nombre de la columna por la cual estratificar, si no se indica el orden.
+
+    Returns:
+        DataFrame: La muestra, o el DataFrame completo si `size` no es menor al total.
+    """
+    if size >= X.shape[0]:
+        return X
+
+    if order is None:
+        order = getSampleOrder(X, stratify=stratify)
+
+    return X.iloc[np.sort(order[:size])]
+
+
+def getSampleError(sample, var, total, varType):
+    """
+    Estima el error estándar de una muestra respecto al total de filas, con corrección por población finita.
+    Para variables categóricas se usa el mayor error estándar de las proporciones de cada categoría;
+    para variables numéricas, el error estándar de la media.
+
+    Args:
+        sample (DataFrame): La muestra.
+        var (str): Nombre de la columna graficada.
+        total (int): Cantidad total de filas del DataFrame original.
+        varType (str): El tipo de la variable (CAT | CONT | DISC).
+
+    Returns:
+        float: El error estándar estimado (0 si la muestra es el total).
+    """
+    n = sample.shape[0]
+    if n >= total or n == 0:
+        return 0.0
+
+    fpc = np.sqrt((total - n) / (total - 1))  # Corrección por población finita
+
+    if varType == "CAT":
+        p = sample[var].value_counts(normalize=True).to_numpy()
+        return float(np.max(np.sqrt(p * (1 - p) / n)) * fpc)
+
+    values = pd.to_numeric(sample[var], errors='coerce').dropna()
+    if len(values) < 2:
+        return float('nan')
+    return float(values.std() / np.sqrt(len(values)) * fpc)
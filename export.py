@@ -0,0 +1,193 @@
+'''
+    Exportación por lotes de gráficos a archivos PNG/SVG.
+
+    Los gráficos se generan sobre el backend Agg (sin ventana), reutilizando un conjunto de
+    figuras (y sus lienzos) que se limpian entre un gráfico y otro en lugar de crear figuras nuevas.
+    Uso en consola:
+        python export.py data.csv carpeta_salida --formato svg
+'''
+
+import io  # Librería para generar archivos en memoria
+import os  # Librería para manejo de rutas y carpetas
+import re  # Librería para expresiones regulares
+import sys  # Librería para manipulación del sistema
+import argparse  # Librería para leer los argumentos de consola
+import pandas as pd  # Librería para manipulación de datos
+from matplotlib.figure import Figure  # Figuras independientes de pyplot
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # Backend sin ventana
+from utils import *  # Importa funciones auxiliares desde utils.py
+
+
+def getFigure(pool, figsize=(4, 3), dpi=100):
+    """
+    Obtiene del conjunto una figura limpia con ejes nuevos, creando la figura solo la primera vez.
+
+    Args:
+        pool (dict): Conjunto de figuras de la forma { (figsize, dpi): figura }.
+        figsize (tuple): Tamaño de la figura en pulgadas.
+        dpi (int): Resolución de la figura.
+
+    Returns:
+        tuple: La figura y sus ejes principales, listos para dibujar.
+    """
+    key = (tuple(figsize), dpi)
+
+    if key not in pool:
+        # Las figuras no se registran en pyplot, por lo que no quedan abiertas globalmente
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        pool[key] = fig
+
+    fig = pool[key]
+
+    # Axes.clear() conserva la proporción, las marcas y los márgenes del gráfico anterior
+    # (torta, Pareto con su eje secundario), por lo que se limpia la figura completa
+    fig.clear()
+    ax = fig.add_subplot()
+
+    return fig, ax
+
+
+def closeFigures(pool):
+    """
+    Libera todas las figuras del conjunto.
+
+    Args:
+        pool (dict): Conjunto de figuras creado por getFigure.
+    """
+    for fig in pool.values():
+        fig.clear()
+    pool.clear()
+
+
+def getExportPairs(X, categorical=None, continuous=None, discreet=None):
+    """
+    Devuelve todos los pares (variable, tipo de gráfico) aplicables a las columnas del DataFrame.
+
+    Args:
+        X (DataFrame): El DataFrame a analizar.
+        categorical (list): Lista de nombres de columnas categóricas.
+        continuous (list): Lista de nombres de columnas continuas.
+        discreet (list): Lista de nombres de columnas discretas.
+
+    Returns:
+        list: Una lista de tuplas de la forma (variable, tipo_grafico).
+    """
+    if categorical == None or continuous == None or discreet == None:
+        categorical, continuous, discreet = identifyVariables(X)
+
+    pairs = []
+    for varType, columns in [("CAT", categorical), ("CONT", continuous), ("DISC", discreet)]:
+        for col in columns:
+            pairs += [(col, t) for t in getPlotSingleVariableTypes(varType)]
+    return pairs
+
+
+def renderPlot(X, var, type, pool, fmt="png", font_size=8, figsize=(4, 3), dpi=100, outliers=None):
+    """
+    Genera un gráfico sobre una figura del conjunto y lo devuelve como bytes.
+
+    Args:
+        X (DataFrame): El DataFrame con los datos.
+        var (str): Nombre de la columna a graficar.
+        type (str): El tipo de gráfico a crear.
+        pool (dict): Conjunto de figuras reutilizables (ver getFigure).
+        fmt (str): Formato de salida (png | svg).
+        font_size (int): Tamaño de la fuente del gráfico.
+        figsize (tuple): Tamaño de la figura en pulgadas.
+        dpi (int): Resolución de la figura.
+        outliers (dict): Resultado opcional de getOutliers con las estadísticas de caja ya calculadas.
+
+    Returns:
+        bytes: El contenido del archivo generado.
+    """
+    fig, ax = getFigure(pool, figsize, dpi)
+    getPlotByType(type, X, var, font_size, outliers, ax=ax)
+
+    ax.title.set_fontsize(font_size)
+    ax.xaxis.label.set_fontsize(font_size)
+    ax.yaxis.label.set_fontsize(font_size)
+    ax.tick_params(axis='both', which='major', labelsize=font_size)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def exportPlots(X, pairs, folder, fmt="png", font_size=8, figsize=(4, 3), dpi=100):
+    """
+    Genera y guarda en disco un gráfico por cada par (variable, tipo de gráfico).
+
+    Args:
+        X (DataFrame): El DataFrame con los datos.
+        pairs (list): Lista de tuplas de la forma (variable, tipo_grafico).
+        folder (str): Carpeta donde se guardan los archivos.
+        fmt (str): Formato de salida (png | svg).
+        font_size (int): Tamaño de la fuente de los gráficos.
+        figsize (tuple): Tamaño de las figuras en pulgadas.
+        dpi (int): Resolución de las figuras.
+
+    Returns:
+        list: Lista con las rutas de los archivos generados.
+    """
+    if fmt not in ("png", "svg"):
+        raise ValueError(f"Formato no soportado: '{fmt}'. Use 'png' o 'svg'.")
+
+    types = set(getPlotSingleVariableTypes("CAT") + getPlotSingleVariableTypes("CONT")
+                + getPlotSingleVariableTypes("DISC"))
+    for var, type in pairs:
+        if var not in X.columns:
+            raise ValueError(f"La variable '{var}' no está en el DataFrame.")
+        if type not in types:
+            raise ValueError(f"Tipo de gráfico no válido: '{type}'.")
+
+    os.makedirs(folder, exist_ok=True)
+
+    # Calcula las estadísticas de caja de todas las variables en una sola pasada
+    box_vars = list(dict.fromkeys(var for var, type in pairs if type == "Box Plot"))
+    outliers = getOutliers(X, box_vars) if box_vars else None
+
+    pool = {}  # Conjunto de figuras reutilizables
+    paths = []  # Lista de archivos generados
+
+    try:
+        for var, type in pairs:
+            content = renderPlot(X, var, type, pool, fmt, font_size, figsize, dpi, outliers)
+
+            # Nombre de archivo seguro a partir de la variable y el tipo de gráfico
+            name = re.sub(r'[^\w.-]+', '_', f"{var}_{type}").strip('_')
+            path = os.path.join(folder, f"{name}.{fmt}")
+            with open(path, 'wb') as f:
+                f.write(content)
+            paths.append(path)
+    finally:
+        # Libera las figuras aunque ocurra un error a mitad de la exportación
+        closeFigures(pool)
+
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporta los gráficos de un archivo CSV.")
+    parser.add_argument("path", help="Ruta al archivo CSV.")
+    parser.add_argument("folder", help="Carpeta de salida.")
+    parser.add_argument("--formato", choices=["png", "svg"], default="png", help="Formato de salida.")
+    parser.add_argument("--variables", nargs="*", help="Variables a exportar (por defecto, todas).")
+    args = parser.parse_args()
+
+    X = readCSV(args.path)
+    if type(X) == str:
+        print(X)
+        sys.exit(1)
+
+    # Convierte las variables numéricas, forzando a NaN los valores no convertibles
+    categorical, continuous, discreet = identifyVariables(X)
+    numerics = continuous + discreet
+    X[numerics] = X[numerics].apply(pd.to_numeric, errors='coerce')
+
+    pairs = getExportPairs(X, categorical, continuous, discreet)
+    if args.variables:
+        pairs = [p for p in pairs if p[0] in args.variables]
+
+    paths = exportPlots(X, pairs, args.folder, args.formato)
+    print(f"Se exportaron {len(paths)} gráficos en '{args.folder}'.")
@@ -1,11 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from utils import *
 
+# Tamaño de la primera muestra y cada cuánto (ms) se revisa si el siguiente refinamiento está listo
+SAMPLE_FIRST_SIZE = 2000
+SAMPLE_REFINE_DELAY = 50
+
+# Hilo de trabajo que calcula los gráficos progresivos fuera del hilo de Tk.
+# Es uno solo porque matplotlib y seaborn no son seguros entre hilos.
+SAMPLE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
 class CollapsibleFrame(ttk.Frame):
     def __init__(self, parent, title, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
@@ -36,6 +46,12 @@ class CollapsibleFrame(ttk.Frame):
         self.graph_type = tk.StringVar(value="Gráfico de Barras")
         self.data = None  
         self.variable = None  
+        self.outliers = None
+        self.varType = None
+        self.canvas = None
+        self.refine_job = None
+        self.sample_prefix = None
+        self.sample_order = None
 
     def toggle(self):
         if self._visible:
@@ -46,9 +62,11 @@ class CollapsibleFrame(ttk.Frame):
             self.toggle_button.config(text=self._title)
         self._visible = not self._visible
 
-    def add_statistics(self, n, st, data, variable, varType):
+    def add_statistics(self, n, st, data, variable, varType, outliers=None):
         self.data = data
         self.variable = variable
+        self.outliers = outliers
+        self.varType = varType
 
         labels = ["Media:", "Mediana:", "Moda:", "Desviación estándar:", "Valores nulos"]
         values = [f"{st[0]}",
@@ -56,6 +74,10 @@ class CollapsibleFrame(ttk.Frame):
                   f"{st[2]}",
                   f"{st[3]}\n",
                   f"{n[0]} ({n[1]*100:.2f}% del total)."]
+        if outliers is not None and variable in outliers:
+            o = outliers[variable]
+            labels.append("Valores atípicos (IQR):")
+            values.append(f"{o['iqr'][0]} ({o['tasa']*100:.2f}% de los valores).")
         for row, (label, value) in enumerate(zip(labels, values)):
             ttk.Label(self.stats_frame, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=2)
             ttk.Label(self.stats_frame, text=value).grid(row=row, column=1, sticky='w', padx=5, pady=2)
@@ -66,31 +88,102 @@ class CollapsibleFrame(ttk.Frame):
         self.graph_button = ttk.Button(self.button_frame, text="Generar gráfico", command=self.generate_graph)
         self.graph_button.pack(pady=10)
         
+    def cancel_refine(self):
+        # Detiene la espera del refinamiento en curso (si lo hay)
+        if self.refine_job is not None:
+            self.after_cancel(self.refine_job)
+            self.refine_job = None
+
+    def destroy(self):
+        self.cancel_refine()
+        super().destroy()
+
     def generate_graph(self):
         graph_type = self.graph_type.get()
 
         font_size = 8  
 
+        self.cancel_refine()
+        for widget in self.button_frame.winfo_children():
+            widget.destroy()
+        self.canvas = None
+
         if self.data is not None and self.variable is not None:
-            fig, ax = getPlotByType(graph_type, self.data, self.variable, font_size)
+            # Grafica primero una muestra pequeña y la refina hasta usar todos los datos.
+            # El orden de las filas se calcula en el hilo de trabajo, después de la primera muestra
+            self.sample_prefix = None
+            self.sample_order = None
+            self.sample_sizes = getSampleSizes(self.data.shape[0], SAMPLE_FIRST_SIZE)
+            self.draw_sample(graph_type, font_size, 0)
         else:
             fig, ax = plt.subplots(figsize=(4,3))
             ax.text(0.5, 0.5, 'No data available', horizontalalignment='center', verticalalignment='center', fontsize=font_size)
             ax.set_title('Error', fontsize=font_size)
-        
+            self.show_figure(fig, ax, font_size)
+
+    def draw_sample(self, graph_type, font_size, step):
+        # El muestreo y el cálculo del gráfico se hacen en el hilo de trabajo; Tk solo muestra el resultado
+        future = SAMPLE_EXECUTOR.submit(self.render_sample, graph_type, font_size, self.sample_sizes[step])
+        self.wait_sample(future, graph_type, font_size, step)
+
+    def wait_sample(self, future, graph_type, font_size, step):
+        self.refine_job = None
+        if not self.winfo_exists():
+            return  # La ventana se cerró mientras se calculaba el gráfico
+
+        if not future.done():
+            self.refine_job = self.after(SAMPLE_REFINE_DELAY,
+                                         lambda: self.wait_sample(future, graph_type, font_size, step))
+            return
+
+        fig, ax = future.result()
+        self.show_figure(fig, ax, font_size)
+
+        # Empieza el siguiente refinamiento mientras la interfaz sigue respondiendo
+        if step + 1 < len(self.sample_sizes):
+            self.draw_sample(graph_type, font_size, step + 1)
+
+    def render_sample(self, graph_type, font_size, size):
+        # Se ejecuta en SAMPLE_EXECUTOR: no debe usar Tk ni pyplot, solo una figura propia
+        total = self.data.shape[0]
+
+        if self.sample_prefix is None:
+            # Primera muestra: aleatoria simple, su costo depende solo de su tamaño
+            self.sample_prefix = getSamplePrefix(total, size)
+            sample = self.data.iloc[np.sort(self.sample_prefix)]
+        else:
+            if self.sample_order is None:
+                # Se calcula una sola vez; las variables categóricas se estratifican para conservar
+                # la proporción de cada categoría, y el orden empieza por la primera muestra
+                stratify = self.variable if self.varType == "CAT" else None
+                self.sample_order = getSampleOrder(self.data, stratify=stratify, prefix=self.sample_prefix)
+            sample = getSample(self.data, size, self.sample_order)
+
+        # Las estadísticas de caja precalculadas solo son válidas para los datos completos
+        outliers = self.outliers if sample.shape[0] >= total else None
+        fig = Figure(figsize=(4,3))
+        ax = fig.add_subplot()
+        getPlotByType(graph_type, sample, self.variable, font_size, outliers, ax)
+        error = getSampleError(sample, self.variable, total, self.varType)
+        annotateSample(ax, sample.shape[0], total, error, font_size)
+        return fig, ax
+
+    def show_figure(self, fig, ax, font_size):
         ax.title.set_fontsize(font_size)
         ax.xaxis.label.set_fontsize(font_size)
         ax.yaxis.label.set_fontsize(font_size)
         ax.tick_params(axis='both', which='major', labelsize=font_size)
-        
-        for widget in self.button_frame.winfo_children():
-            widget.destroy()
 
-        canvas = FigureCanvasTkAgg(fig, master=self.button_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        # Reemplaza el gráfico anterior y libera su figura
+        if self.canvas is not None:
+            self.canvas.get_tk_widget().destroy()
+            plt.close(self.canvas.figure)
+
+        self.canvas = FigureCanvasTkAgg(fig, master=self.button_frame)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
-def create_tab_content(parent, collapsibles, nulls, statistics, data, varType):
+def create_tab_content(parent, collapsibles, nulls, statistics, data, varType, outliers=None):
     collapsibles_container = ttk.Frame(parent)
     
     canvas = tk.Canvas(collapsibles_container)
@@ -109,7 +202,7 @@ def create_tab_content(parent, collapsibles, nulls, statistics, data, varType):
         collapsible = CollapsibleFrame(tab_content, collapsibles[i])
         st = statistics[collapsibles[i]] if collapsibles[i] in statistics.keys() else ["N/A"]*4
         n = nulls[collapsibles[i]] if collapsibles[i] in nulls.keys() else [0,0]
-        collapsible.add_statistics(n, st, data, collapsibles[i], varType)
+        collapsible.add_statistics(n, st, data, collapsibles[i], varType, outliers)
         collapsible.pack(fill='x')
     
     collapsibles_container.pack(fill="both", expand=True)
@@ -128,14 +221,15 @@ def show_main_window(X):
     null_values = getNulls(X)
     numerics = continuous + discreet
     statistics = getStatistics(X, numerics)
+    outliers = getOutliers(X, numerics)
     
     for tab_name in ["Categóricas", "Continuas", "Discretas"]:
         if tab_name == "Categóricas":
             tab_content = create_tab_content(notebook, categorical, null_values, statistics, X, "CAT")
         elif tab_name == "Continuas":
-            tab_content = create_tab_content(notebook, continuous, null_values, statistics, X, "CONT")
+            tab_content = create_tab_content(notebook, continuous, null_values, statistics, X, "CONT", outliers)
         else:
-            tab_content = create_tab_content(notebook, discreet, null_values, statistics, X, "DISC")
+            tab_content = create_tab_content(notebook, discreet, null_values, statistics, X, "DISC", outliers)
         notebook.add(tab_content, text=tab_name)
 
     notebook.pack(expand=True, fill="both")
@@ -0,0 +1,208 @@
+'''
+    Núcleos de cómputo para los recorridos más costosos del perfilado: verificación de valores
+    enteros, conteo de nulos junto con los momentos, histogramas y conteo de frecuencias.
+
+    Si numba está instalado los núcleos se compilan a código nativo en su primera llamada (un solo
+    recorrido por columna, sin arreglos temporales); si no, se usan versiones equivalentes en numpy.
+    Ambas versiones devuelven los mismos resultados. BACKEND indica cuál está en uso.
+'''
+
+import importlib.util  # Permite saber si numba está instalado sin importarlo
+import numpy as np  # Librería para operaciones numéricas
+
+# numba se importa y los núcleos se compilan recién en la primera llamada, para que importar
+# `core` siga siendo liviano aunque numba esté instalado
+BACKEND = "numba" if importlib.util.find_spec("numba") is not None else "numpy"
+
+_kernels = None  # Núcleos en uso, elegidos en la primera llamada (ver getKernels)
+
+
+def _isIntegralNumpy(values):
+    # Los infinitos no son enteros (igual que float.is_integer); los nulos se ignoran
+    valid = values[~np.isnan(values)]
+    return bool(np.isfinite(valid).all() and (valid == np.floor(valid)).all())
+
+
+def _getNullMomentsNumpy(values):
+    valid = values[~np.isnan(values)]
+    n = len(valid)
+    if n == 0:
+        return len(values), 0, 0.0, 0.0
+    mean = valid.mean()
+    return len(values) - n, n, mean, float(((valid - mean) ** 2).sum())
+
+
+def _binValuesNumpy(values, low, width, bins):
+    valid = values[~np.isnan(values)]
+    idx = np.clip((valid - low) / width, 0, bins - 1).astype(np.int64)
+    return np.bincount(idx, minlength=bins)
+
+
+def _getRunsNumpy(ordered):
+    # Posiciones donde cambia el valor en el arreglo ordenado
+    change = np.ones(len(ordered), dtype=bool)
+    change[1:] = ordered[1:] != ordered[:-1]
+    starts = np.flatnonzero(change)
+    return ordered[starts], np.diff(np.append(starts, len(ordered)))
+
+
+# Versiones con ciclos explícitos, pensadas para compilarse con numba
+def _isIntegralLoop(values):
+    for v in values:
+        if v != v:
+            continue
+        if not np.isfinite(v) or v != np.floor(v):
+            return False
+    return True
+
+
+def _getNullMomentsLoop(values):
+    # Algoritmo de Welford: nulos, cantidad, media y suma de cuadrados en un solo recorrido
+    nulls = 0
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in values:
+        if v != v:
+            nulls += 1
+            continue
+        n += 1
+        delta = v - mean
+        mean += delta / n
+        m2 += delta * (v - mean)
+    return nulls, n, mean, m2
+
+
+def _binValuesLoop(values, low, width, bins):
+    counts = np.zeros(bins, dtype=np.int64)
+    for v in values:
+        if v != v:
+            continue
+        x = min(max((v - low) / width, 0.0), bins - 1.0)
+        counts[int(x)] += 1
+    return counts
+
+
+def _getRunsLoop(ordered):
+    uniques = np.empty_like(ordered)
+    counts = np.zeros(len(ordered), dtype=np.int64)
+    k = -1
+    for i in range(len(ordered)):
+        if k < 0 or ordered[i] != uniques[k]:
+            k += 1
+            uniques[k] = ordered[i]
+        counts[k] += 1
+    return uniques[:k + 1], counts[:k + 1]
+
+
+NUMPY_KERNELS = {"isIntegral": _isIntegralNumpy, "getNullMoments": _getNullMomentsNumpy,
+                 "binValues": _binValuesNumpy, "getRuns": _getRunsNumpy}
+LOOP_KERNELS = {"isIntegral": _isIntegralLoop, "getNullMoments": _getNullMomentsLoop,
+                "binValues": _binValuesLoop, "getRuns": _getRunsLoop}
+
+
+def compileKernels():
+    """
+    Importa numba y compila los núcleos con ciclos explícitos (la compilación de cada uno
+    ocurre en su primera llamada y se guarda en caché en disco).
+
+    Returns:
+        dict: Núcleos compilados por nombre. Lanza ImportError si numba no está instalado.
+    """
+    import numba  # Compilador JIT opcional
+    return {name: numba.njit(cache=True, nogil=True)(loop) for name, loop in LOOP_KERNELS.items()}
+
+
+def getKernels():
+    """
+    Devuelve los núcleos en uso: los compilados con numba si está disponible o los de numpy.
+    Se eligen una sola vez, en la primera llamada.
+
+    Returns:
+        dict: Núcleos por nombre.
+    """
+    global _kernels, BACKEND
+    if _kernels is None:
+        try:
+            _kernels = compileKernels() if BACKEND == "numba" else NUMPY_KERNELS
+        except ImportError:
+            # numba aparece instalado pero no se puede importar: se usa numpy
+            BACKEND = "numpy"
+            _kernels = NUMPY_KERNELS
+    return _kernels
+
+
+def toFloat(values):
+    """
+    Convierte un arreglo a float64 contiguo (sin copiar si ya lo es), formato que esperan los núcleos.
+
+    Args:
+        values (array): Arreglo numérico.
+
+    Returns:
+        ndarray: El arreglo como float64 contiguo.
+    """
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def isIntegral(values):
+    """
+    Verifica si todos los valores no nulos de un arreglo son enteros.
+
+    Args:
+        values (array): Arreglo numérico.
+
+    Returns:
+        bool: True si todos los valores no nulos son enteros finitos.
+    """
+    if values.dtype.kind in "iub":
+        return True
+    return bool(getKernels()["isIntegral"](toFloat(values)))
+
+
+def getNullMoments(values):
+    """
+    Cuenta los nulos y acumula la cantidad, la media y la suma de cuadrados de las desviaciones
+    de un arreglo en un solo recorrido.
+
+    Args:
+        values (array): Arreglo numérico.
+
+    Returns:
+        tuple: (nulos, cantidad, media, m2); la varianza muestral es m2 / (cantidad - 1).
+    """
+    nulls, n, mean, m2 = getKernels()["getNullMoments"](toFloat(values))
+    return int(nulls), int(n), float(mean), float(m2)
+
+
+def binValues(values, low, width, bins):
+    """
+    Cuenta los valores no nulos de un arreglo en intervalos de igual ancho a partir de low.
+    Los valores fuera del rango se acumulan en el primer o el último intervalo.
+
+    Args:
+        values (array): Arreglo numérico.
+        low (float): Límite inferior del primer intervalo.
+        width (float): Ancho de cada intervalo.
+        bins (int): Cantidad de intervalos.
+
+    Returns:
+        ndarray: Cantidad de valores en cada intervalo.
+    """
+    return getKernels()["binValues"](toFloat(values), float(low), float(width), int(bins))
+
+
+def countFrequencies(values):
+    """
+    Cuenta cuántas veces aparece cada valor no nulo de un arreglo.
+    Conserva el tipo de datos del arreglo (los enteros siguen siendo enteros).
+
+    Args:
+        values (array): Arreglo numérico.
+
+    Returns:
+        tuple: (valores, frecuencias) con los valores distintos en orden ascendente.
+    """
+    if values.dtype.kind == "f":
+        values = values[~np.isnan(values)]
+    return getKernels()["getRuns"](np.sort(values))
@@ -12,21 +12,37 @@
 # Importación de librerías necesarias
 import pandas as pd  # Librería para manipulación de datos
 import numpy as np  # Librería para operaciones numéricas
-import matplotlib.pyplot as plt  # Librería para generación de gráficos
-from utils import *  # Importa funciones auxiliares desde utils.py
+from core import *  # Importa las funciones de perfilado desde core.py
+from planner import parseMemory, getProfileChunked  # Planificador según el límite de memoria
 import sys  # Librería para manipulación del sistema
+import argparse  # Librería para leer los argumentos de consola
+
+# Lee el límite de memoria opcional (p. ej. python main.py --memory-budget 512MB)
+parser = argparse.ArgumentParser(description="Análisis Exploratorio de Datos de un archivo CSV.")
+parser.add_argument("--memory-budget", type=parseMemory, default=None,
+                    help="Límite de memoria para el análisis (p. ej. 512MB, 2GB).")
+parser.add_argument("--targets", nargs="*", default=[],
+                    help="Variables categóricas por las cuales desglosar las variables numéricas (p. ej. Biopsy Schiller).")
+args = parser.parse_args()
+
 # Solicita al usuario ingresar la ruta del archivo CSV a analizar
 path = input("Ingrese el archivo csv a analizar: ")
 # Lee el archivo CSV y lo almacena en un DataFrame
-X = readCSV(path)
+X = readCSV(path, args.memory_budget)
 
 # Verifica si la lectura del archivo fue exitosa
 if type(X) == str:
     print(X)  # Imprime el mensaje de error
     sys.exit()  # Termina la ejecución del programa
 
+# Imprime la estrategia elegida según el límite de memoria
+plan = X.attrs.get("plan")
+if plan is not None:
+    print(f"\nEstrategia de ejecución: {plan['estrategia']}")
+    print(plan["razon"])
+
 # Identifica las variables categóricas, continuas y discretas en el DataFrame
-categorical, continuous, discreet = identifyVariables(X.copy())
+categorical, continuous, discreet = identifyVariables(X)
 
 # Imprime las variables categóricas
 print("\nVariables categóricas:")
@@ -44,8 +60,12 @@ for i, col in enumerate(discreet, 1):
     print(f"{i}. {col}")
 
 # Obtiene las columnas con valores nulos y la cantidad de nulos en cada una
-
-null_values = getNulls(X)
+if plan is not None and plan["estrategia"] == "sketch":
+    # X es una muestra; los nulos y las estadísticas se calculan sobre el archivo completo por bloques
+    null_values, full_statistics = getProfileChunked(path, continuous + discreet, plan["tamano_bloque"],
+                                                     max_distinct=plan["max_distintos"])
+else:
+    null_values = getNulls(X)
 
 # Verifica si existen valores nulos en el DataFrame
 if len(null_values) > 0:
@@ -57,7 +77,15 @@ if len(null_values) > 0:
 numerics = continuous + discreet
 
 # Obtiene las estadísticas descriptivas para las variables numéricas
-statistics = getStatistics(X, numerics)
+if plan is not None and plan["estrategia"] == "sketch":
+    # Ya se calcularon sobre el archivo completo; de la muestra solo se convierten las columnas
+    # que no son numéricas (como lo haría getStatistics) para los gráficos
+    statistics = full_statistics
+    for col in numerics:
+        if not pd.api.types.is_numeric_dtype(X[col]):
+            X[col] = pd.to_numeric(X[col], errors='coerce')
+else:
+    statistics = getStatistics(X, numerics)
 
 # Verifica si existen estadísticas descriptivas para imprimir
 if len(statistics) > 0:
@@ -70,6 +98,42 @@ if len(statistics) > 0:
         print(f"Moda: {st[2]}")
         print(f"Desviación Estándar: {st[3]}\n")
 
+# Detecta los valores atípicos de todas las variables numéricas en una sola pasada
+outliers = getOutliers(X, numerics)
+
+# Imprime las variables ordenadas por su tasa de valores atípicos
+ranking = [r for r in rankOutliers(outliers) if r[1] > 0]
+if len(ranking) > 0 and plan is not None and plan["estrategia"] in ("sketch", "muestreo"):
+    # X es una muestra: las cantidades no son las del archivo completo, solo la tasa es una estimación
+    print(f"\nVariables con valores atípicos (criterio IQR, estimado sobre una muestra de {X.shape[0]} filas):")
+    for col, count, rate in ranking:
+        print(f"La columna '{col}' contiene aproximadamente un {rate*100:.2f}% de valores atípicos "
+              f"({count} en la muestra).")
+elif len(ranking) > 0:
+    print("\nVariables con valores atípicos (criterio IQR):")
+    for col, count, rate in ranking:
+        print(f"La columna '{col}' contiene {count} valores atípicos ({rate*100:.2f}% de los valores).")
+
+# Desglosa todas las variables numéricas por cada variable objetivo en una sola pasada agrupada
+grouped = {}
+for target in args.targets:
+    if target not in categorical:
+        print(f"\nLa variable '{target}' no es categórica; se omite el desglose.")
+        continue
+
+    # Incluye la densidad para que los gráficos de violín tampoco vuelvan a recorrer las filas
+    grouped[target] = getGroupedStatistics(X, target, numerics, density=True)
+    if plan is not None and plan["estrategia"] in ("sketch", "muestreo"):
+        # X es una muestra: las cantidades son de la muestra y el resto de los valores son estimaciones
+        print(f"\nEstadísticas por categoría de '{target}' (estimadas sobre una muestra de {X.shape[0]} filas):")
+    else:
+        print(f"\nEstadísticas por categoría de '{target}':")
+    for col, groups in grouped[target].items():
+        print(f"Variable {col}:")
+        for label, g in groups.items():
+            print(f"  {target} = {label}: n={g['cantidad']}, media={g['media']}, "
+                  f"desviación={g['desviacion']}, mediana={g['mediana']}, nulos={g['tasa_nulos']*100:.2f}%")
+
 # Solicita al usuario si desea generar gráficos
 option = getOption("¿Desea generar gráficos?\n1. Sí\n2. No\n", 2)
 
@@ -78,6 +142,9 @@ if option == 2:
     print("¡Gracias por utilizar el programa!")
     sys.exit()
 
+# Los módulos de gráficos (matplotlib, seaborn, tkinter) se cargan solo al momento de graficar
+from utils import getPlotSingleVariable, getPlotTwoVariables
+
 # Variable para controlar el bucle de generación de gráficos
 graphing = True
 
@@ -120,7 +187,7 @@ while (graphing):
         # Si se seleccionaron 2 variables, genera un gráfico para esa varaible
         if len(chosen) == 2:
             getPlotTwoVariables(
-                X, chosen[0], chosen[1], categorical, continuous, discreet)
+                X, chosen[0], chosen[1], categorical, continuous, discreet, grouped)
 
         # Solicita al usuario si desea generar otro gráfico para la selección actual
         option = getOption(
@@ -0,0 +1,352 @@
+'''
+    Planificador de ejecución según un límite de memoria.
+
+    A partir del tamaño del archivo y de una muestra de sus primeras filas se estima la memoria
+    que usará cada etapa (lectura, perfilado y gráficos) y se elige una estrategia:
+        - memoria:  se carga el archivo completo.
+        - bloques:  se lee por bloques reduciendo los tipos de datos sin pérdida y se unen los bloques.
+        - sketch:   el perfilado se calcula recorriendo el archivo por bloques con resúmenes acotados;
+                    los gráficos usan una muestra que cabe en memoria.
+        - muestreo: ni siquiera un bloque mínimo cabe; se lee solo una muestra aleatoria de filas.
+'''
+
+import os  # Librería para manejo de archivos
+import re  # Librería para expresiones regulares
+import numpy as np  # Librería para operaciones numéricas
+import pandas as pd  # Librería para manipulación de datos
+from kernels import binValues  # Núcleo compilado (opcional) para los histogramas
+
+# Cantidad de filas que se leen para estimar el esquema y el tamaño de cada fila
+SAMPLE_ROWS = 1000
+
+# Tamaño mínimo de un bloque para la estrategia sketch
+MIN_CHUNK_ROWS = 1000
+
+# Cantidad de intervalos del histograma usado para aproximar la mediana y la moda
+SKETCH_BINS = 4096
+
+# Máxima cantidad de valores distintos por columna para calcular la moda exacta
+# (planExecution la reduce según el límite de memoria y la cantidad de columnas)
+SKETCH_MAX_DISTINCT = 100000
+
+# Memoria de trabajo del perfilado, medida con tracemalloc sobre 500k filas x 10 columnas:
+# getOutliers mantiene la matriz numérica, una matriz auxiliar y sus máscaras (~21 B por celda)
+# y getStatistics / identifyVariables crean temporales de una columna a la vez (~6 copias de 8 B)
+PROFILE_BYTES_CELL = 24
+PROFILE_BYTES_ROW = 48
+
+# Memoria por cada frecuencia guardada en el sketch (índice, conteo y alineación al sumar)
+FREQ_ENTRY_BYTES = 32
+
+UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024**2, "MB": 1024**2,
+         "G": 1024**3, "GB": 1024**3, "T": 1024**4, "TB": 1024**4}
+
+
+def parseMemory(text):
+    """
+    Convierte un límite de memoria como "512MB" o "2G" a bytes.
+
+    Args:
+        text (str | int): El límite de memoria; un entero se interpreta en bytes.
+
+    Returns:
+        int: El límite en bytes.
+    """
+    if isinstance(text, (int, float)):
+        return int(text)
+
+    match = re.fullmatch(r'\s*([\d.]+)\s*([a-zA-Z]*)\s*', str(text))
+    if not match or match.group(2).upper() not in UNITS:
+        raise ValueError(f"Límite de memoria no válido: '{text}'. Use por ejemplo 512MB o 2GB.")
+    return int(float(match.group(1)) * UNITS[match.group(2).upper()])
+
+
+def formatMemory(size):
+    """
+    Devuelve una cantidad de bytes en formato legible (p. ej. "1.5 GB").
+
+    Args:
+        size (float): La cantidad de bytes.
+
+    Returns:
+        str: La cantidad formateada.
+    """
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def reduceTypes(X):
+    """
+    Reduce el tamaño en memoria de un DataFrame sin perder información:
+        - Enteros al tipo entero más pequeño que los contiene.
+        - Flotantes a float32 solo si todos sus valores se representan exactamente.
+        - Texto con pocos valores distintos a categorías.
+
+    Args:
+        X (DataFrame): El DataFrame a reducir.
+
+    Returns:
+        DataFrame: El DataFrame con los tipos reducidos.
+    """
+    X = X.copy()
+    for col in X.columns:
+        if pd.api.types.is_integer_dtype(X[col]):
+            X[col] = pd.to_numeric(X[col], downcast='integer')
+        elif pd.api.types.is_float_dtype(X[col]):
+            reduced = X[col].astype(np.float32)
+            if ((reduced.astype(np.float64) == X[col]) | X[col].isna()).all():
+                X[col] = reduced
+        elif pd.api.types.is_string_dtype(X[col].dtype) and X[col].nunique() <= len(X[col]) // 2:
+            X[col] = X[col].astype('category')
+    return X
+
+
+def estimateMemory(path, sample_rows=SAMPLE_ROWS):
+    """
+    Estima la cantidad de filas del archivo y la memoria que usa cada fila.
+
+    Args:
+        path (str): La ruta al archivo CSV.
+        sample_rows (int): Cantidad de filas leídas para la estimación.
+
+    Returns:
+        dict: Diccionario con las filas estimadas, las columnas y los bytes por fila
+        en disco, en memoria y con los tipos reducidos.
+    """
+    size = os.path.getsize(path)
+    head = pd.read_csv(path, nrows=sample_rows)
+    n = max(len(head), 1)
+
+    # Bytes en disco de las filas leídas, para extrapolar la cantidad total de filas
+    with open(path, 'rb') as f:
+        header = len(f.readline())
+        disk_bytes = sum(len(f.readline()) for _ in range(len(head)))
+    disk_row = max(disk_bytes / n, 1)
+
+    return {
+        "filas": max(int((size - header) / disk_row), len(head)),
+        "columnas": head.shape[1],
+        "bytes_disco": disk_row,
+        "bytes_fila": head.memory_usage(deep=True, index=False).sum() / n,
+        "bytes_fila_reducida": reduceTypes(head).memory_usage(deep=True, index=False).sum() / n,
+    }
+
+
+def planExecution(path, memory_budget):
+    """
+    Elige la estrategia de ejecución que permite terminar dentro del límite de memoria.
+
+    El perfilado es la etapa más costosa: además del DataFrame, getOutliers mantiene una matriz de
+    flotantes con las columnas numéricas, una matriz auxiliar y sus máscaras, por lo que se estima
+    como el DataFrame más PROFILE_BYTES_CELL bytes por celda y PROFILE_BYTES_ROW bytes por fila.
+    En la estrategia sketch el límite se reparte: la mitad para la muestra que queda en memoria,
+    un cuarto para cada bloque (incluyendo el búfer del lector) y un cuarto para las frecuencias.
+
+    Args:
+        path (str): La ruta al archivo CSV.
+        memory_budget (str | int): El límite de memoria (p. ej. "512MB").
+
+    Returns:
+        dict: Diccionario con la estrategia elegida, la razón, la estimación de cada etapa,
+        el tamaño de bloque, la cantidad de filas de la muestra y el máximo de frecuencias por columna (si aplica).
+    """
+    budget = parseMemory(memory_budget)
+    est = estimateMemory(path)
+    rows, cols = est["filas"], est["columnas"]
+
+    def stages(row_bytes, n):
+        # Memoria estimada de cada etapa para n filas de row_bytes bytes
+        return {"lectura": n * row_bytes,
+                "perfil": n * (row_bytes + PROFILE_BYTES_CELL * cols + PROFILE_BYTES_ROW),
+                "graficos": n * (row_bytes + 16)}
+
+    full = stages(est["bytes_fila"], rows)
+    reduced = stages(est["bytes_fila_reducida"], rows)
+    reduced["lectura"] *= 2  # Al unir los bloques conviven la lista de bloques y el DataFrame final
+    plan = {"limite": budget, "estimacion": est, "etapas": full,
+            "tamano_bloque": None, "filas_muestra": None, "max_distintos": None}
+
+    if max(full.values()) <= budget:
+        plan["estrategia"] = "memoria"
+        plan["razon"] = (f"El perfilado completo usa ~{formatMemory(full['perfil'])}, "
+                         f"dentro del límite de {formatMemory(budget)}.")
+        return plan
+
+    # Un bloque ocupa el texto leído, el DataFrame del bloque y su matriz numérica (con una copia temporal)
+    chunk_row = est["bytes_disco"] + est["bytes_fila"] + 16 * cols
+    per_row = stages(est["bytes_fila"], 1)["perfil"]
+
+    if max(reduced.values()) <= budget:
+        plan["estrategia"] = "bloques"
+        plan["etapas"] = reduced
+        plan["tamano_bloque"] = max(int(budget / 2 / chunk_row), MIN_CHUNK_ROWS)
+        plan["razon"] = (f"El archivo completo requiere ~{formatMemory(full['perfil'])}; "
+                         f"leyéndolo por bloques con tipos reducidos baja a ~{formatMemory(reduced['perfil'])}.")
+    elif MIN_CHUNK_ROWS * chunk_row <= budget / 4:
+        plan["estrategia"] = "sketch"
+        plan["tamano_bloque"] = int(budget / 4 / chunk_row)
+        plan["filas_muestra"] = int(budget / 2 / per_row)
+        plan["max_distintos"] = max(min(int(budget / 4 / (FREQ_ENTRY_BYTES * cols)), SKETCH_MAX_DISTINCT), 1)
+        plan["etapas"] = stages(est["bytes_fila"], plan["filas_muestra"])
+        plan["razon"] = (f"Aun con tipos reducidos se requieren ~{formatMemory(reduced['perfil'])}; "
+                         f"nulos y estadísticas se calculan por bloques de {plan['tamano_bloque']} filas "
+                         f"y los gráficos usan una muestra de {plan['filas_muestra']} filas.")
+    else:
+        plan["estrategia"] = "muestreo"
+        plan["filas_muestra"] = max(int(budget / per_row), 1)
+        plan["etapas"] = stages(est["bytes_fila"], plan["filas_muestra"])
+        plan["razon"] = (f"Un bloque de {MIN_CHUNK_ROWS} filas (~{formatMemory(MIN_CHUNK_ROWS * chunk_row)}) "
+                         f"no cabe en un cuarto del límite; todo el análisis se hace sobre una muestra "
+                         f"aleatoria de {plan['filas_muestra']} filas y es aproximado.")
+
+    plan["filas_muestra"] = min(plan["filas_muestra"], rows) if plan["filas_muestra"] else None
+    return plan
+
+
+def readWithPlan(path, plan, seed=0):
+    """
+    Lee el archivo CSV según la estrategia del plan.
+
+    Args:
+        path (str): La ruta al archivo CSV.
+        plan (dict): El plan generado por planExecution.
+        seed (int): Semilla para el muestreo aleatorio.
+
+    Returns:
+        DataFrame: El archivo completo (memoria, bloques) o una muestra de sus filas (sketch, muestreo).
+    """
+    strategy = plan["estrategia"]
+    rng = np.random.default_rng(seed)
+
+    if strategy == "memoria":
+        return pd.read_csv(path)
+
+    if strategy == "bloques":
+        chunks = [reduceTypes(chunk) for chunk in pd.read_csv(path, chunksize=plan["tamano_bloque"])]
+        X = pd.concat(chunks, ignore_index=True)
+        # Las categorías de cada bloque pueden diferir; se vuelven a reducir al unirlas
+        return reduceTypes(X)
+
+    fraction = min(plan["filas_muestra"] / max(plan["estimacion"]["filas"], 1), 1.0)
+
+    if strategy == "sketch":
+        # Muestreo de Bernoulli bloque por bloque; las partes se unen cada tanto porque cada
+        # DataFrame pequeño tiene un costo fijo que, con muchos bloques, supera al de sus filas
+        parts = []
+        for chunk in pd.read_csv(path, chunksize=plan["tamano_bloque"]):
+            parts.append(chunk[rng.random(len(chunk)) < fraction])
+            if len(parts) >= 32:
+                parts = [pd.concat(parts, ignore_index=True)]
+        return pd.concat(parts, ignore_index=True)
+
+    # Muestreo: el lector descarta las filas no elegidas sin cargarlas
+    return pd.read_csv(path, skiprows=lambda i: i > 0 and rng.random() >= fraction)
+
+
+def getChunkMatrix(chunk, numerics):
+    """
+    Convierte las columnas numéricas de un bloque en una matriz de flotantes, columna por columna,
+    sin crear una copia intermedia del bloque.
+
+    Args:
+        chunk (DataFrame): El bloque leído.
+        numerics (list): Lista de nombres de columnas numéricas.
+
+    Returns:
+        ndarray: Matriz de forma (filas, columnas) con NaN en los valores no convertibles.
+    """
+    M = np.empty((len(chunk), len(numerics)))
+    for j, col in enumerate(numerics):
+        M[:, j] = pd.to_numeric(chunk[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    return M
+
+
+def getProfileChunked(path, numerics, chunksize, bins=SKETCH_BINS, max_distinct=SKETCH_MAX_DISTINCT):
+    """
+    Calcula nulos y estadísticas descriptivas recorriendo el archivo por bloques, sin cargarlo completo.
+    La cantidad de nulos, la media y la desviación estándar son exactas; la mediana se interpola
+    desde un histograma y la moda es exacta mientras la columna no supere max_distinct valores distintos.
+
+    Args:
+        path (str): La ruta al archivo CSV.
+        numerics (list): Lista de nombres de columnas numéricas.
+        chunksize (int): Cantidad de filas por bloque.
+        bins (int): Cantidad de intervalos del histograma.
+        max_distinct (int): Máxima cantidad de frecuencias guardadas por columna (ver planExecution).
+
+    Returns:
+        tuple: (nulos, estadisticas) con el mismo formato que getNulls y getStatistics.
+    """
+    total = 0
+    nulls = None
+    k = len(numerics)
+    count = np.zeros(k)
+    mean = np.zeros(k)
+    m2 = np.zeros(k)
+    low = np.full(k, np.inf)
+    high = np.full(k, -np.inf)
+    freqs = [pd.Series(dtype=float) for _ in numerics]
+
+    # Primera pasada: nulos, momentos (combinados con el método de Chan), extremos y frecuencias
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        total += len(chunk)
+        chunk_nulls = chunk.isnull().sum()
+        nulls = chunk_nulls if nulls is None else nulls.add(chunk_nulls, fill_value=0)
+
+        M = getChunkMatrix(chunk, numerics)
+        n = (~np.isnan(M)).sum(axis=0)
+        low = np.fmin(low, np.fmin.reduce(M, axis=0, initial=np.inf))
+        high = np.fmax(high, np.fmax.reduce(M, axis=0, initial=-np.inf))
+
+        for j in range(k):
+            if freqs[j] is not None:
+                freqs[j] = freqs[j].add(pd.Series(M[:, j]).value_counts(), fill_value=0)
+                if len(freqs[j]) > max_distinct:
+                    freqs[j] = None  # Demasiados valores distintos: se usa el histograma
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            chunk_mean = np.where(n > 0, np.nansum(M, axis=0) / n, 0.0)
+            # Las desviaciones se calculan sobre la misma matriz del bloque, que ya no se necesita
+            np.subtract(M, chunk_mean, out=M)
+            chunk_m2 = np.nansum(np.square(M, out=M), axis=0)
+            combined = count + n
+            delta = chunk_mean - mean
+            mean = np.where(combined > 0, mean + delta * n / combined, 0.0)
+            m2 = m2 + chunk_m2 + np.where(combined > 0, delta ** 2 * count * n / combined, 0.0)
+        count = combined
+
+    # Segunda pasada: histograma de cada columna entre su mínimo y su máximo
+    width = np.where(high > low, (high - low) / bins, 1.0)
+    hist = np.zeros((k, bins))
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        M = getChunkMatrix(chunk, numerics)
+        for j in range(k):
+            hist[j] += binValues(M[:, j], low[j], width[j], bins)
+
+    statistics = {}
+    for j, col in enumerate(numerics):
+        if count[j] == 0:
+            statistics[col] = (None, None, None, None)
+            continue
+
+        # Mediana interpolada dentro del intervalo que contiene la mitad de los valores
+        cumulative = np.cumsum(hist[j])
+        b = int(np.searchsorted(cumulative, count[j] / 2))
+        before = cumulative[b - 1] if b > 0 else 0
+        median = low[j] + width[j] * (b + (count[j] / 2 - before) / max(hist[j][b], 1))
+        median = min(max(median, low[j]), high[j])
+
+        if freqs[j] is not None:
+            # Igual que Series.mode(): el menor de los valores más frecuentes
+            mode = freqs[j][freqs[j] == freqs[j].max()].index.min()
+        else:
+            mode = low[j] + width[j] * (np.argmax(hist[j]) + 0.5)
+
+        std = np.sqrt(m2[j] / (count[j] - 1)) if count[j] > 1 else np.nan
+        statistics[col] = (mean[j], median, mode, std)
+
+    nulls = {col: [int(c), c / total] for col, c in nulls.items() if c > 0}
+    return nulls, statistics
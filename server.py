@@ -0,0 +1,398 @@
+'''
+    Servicio local de perfilado de datos.
+
+    Carga cada archivo CSV una sola vez y lo mantiene, junto con sus perfiles, en una caché acotada
+    en memoria. Los cálculos pesados se ejecutan en un conjunto de hilos de trabajo y las solicitudes
+    idénticas que llegan mientras otra está en curso esperan el mismo resultado.
+    Uso en consola:
+        python server.py --port 8765 --data-dir . --cache 1GB
+    Rutas disponibles (GET, con los parámetros en la URL):
+        /types?path=data.csv
+        /nulls?path=data.csv
+        /statistics?path=data.csv
+        /outliers?path=data.csv
+        /association?path=data.csv&var1=Age&var2=Biopsy
+        /grouped?path=data.csv&target=Biopsy
+        /plot?path=data.csv&var=Age&type=Histograma&format=png
+'''
+
+import os  # Librería para manejo de rutas y archivos
+import json  # Librería para generar las respuestas JSON
+import math  # Librería para detectar valores NaN
+import asyncio  # Librería para el servidor asíncrono
+import argparse  # Librería para leer los argumentos de consola
+from collections import OrderedDict  # Diccionario ordenado para la caché LRU
+from concurrent.futures import ThreadPoolExecutor  # Conjunto de hilos de trabajo
+from urllib.parse import urlsplit, parse_qs  # Lectura de la URL y sus parámetros
+import numpy as np  # Librería para operaciones numéricas
+import pandas as pd  # Librería para manipulación de datos
+import matplotlib
+matplotlib.use('Agg')  # El servicio no tiene ventana; se fija el backend antes de importar los gráficos
+from core import *  # Importa las funciones de perfilado desde core.py
+from planner import parseMemory  # Convierte el límite de la caché a bytes
+from utils import getPlotSingleVariableTypes  # Tipos de gráficos según el tipo de variable
+from export import renderPlot, closeFigures  # Generación de gráficos sobre figuras reutilizables
+
+# Tiempo máximo (segundos) para recibir los encabezados de una solicitud
+REQUEST_TIMEOUT = 10
+
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          500: "Internal Server Error"}
+
+
+class ServiceError(Exception):
+    """
+    Error de una solicitud que se responde al cliente con el código HTTP indicado.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class DatasetCache:
+    """
+    Caché LRU de conjuntos de datos acotada por memoria y por cantidad de entradas.
+    Cada entrada guarda el DataFrame, los tipos de sus variables y los resultados ya calculados.
+    Solo se accede desde el bucle de eventos, por lo que no necesita sincronización.
+    """
+
+    def __init__(self, max_bytes, max_datasets=16):
+        self.max_bytes = max_bytes
+        self.max_datasets = max_datasets
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)  # Marca la entrada como la más reciente
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        self.evict()
+
+    def addResult(self, key, name, value, size=0):
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry["resultados"][name] = value
+            entry["bytes"] += size
+            self.evict()
+
+    def size(self):
+        return sum(entry["bytes"] for entry in self.entries.values())
+
+    def evict(self):
+        # Descarta las entradas menos recientes, conservando siempre la última
+        while len(self.entries) > 1 and (len(self.entries) > self.max_datasets
+                                         or self.size() > self.max_bytes):
+            self.entries.popitem(last=False)
+
+
+def toJSON(value):
+    """
+    Convierte un resultado a tipos serializables en JSON (NaN pasa a null).
+
+    Args:
+        value: El valor a convertir.
+
+    Returns:
+        El valor con tipos nativos de Python.
+    """
+    if isinstance(value, dict):
+        return {str(k): toJSON(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray, pd.Index)):
+        return [toJSON(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def estimateSize(value):
+    """
+    Estima la memoria que ocupa un resultado: el largo en bytes de los gráficos o, para los demás
+    resultados, el largo de su representación JSON.
+
+    Args:
+        value: El resultado a medir.
+
+    Returns:
+        int: El tamaño estimado en bytes.
+    """
+    if isinstance(value, bytes):
+        return len(value)
+    return len(json.dumps(toJSON(value), ensure_ascii=False).encode('utf-8'))
+
+
+def computeSized(function, entry, *args):
+    """
+    Ejecuta un cálculo y estima su tamaño en el mismo hilo de trabajo.
+
+    Returns:
+        tuple: (resultado, tamaño estimado en bytes).
+    """
+    value = function(entry, *args)
+    return value, estimateSize(value)
+
+
+def loadDataset(path):
+    """
+    Lee el archivo, identifica sus variables y convierte las columnas numéricas.
+
+    Args:
+        path (str): La ruta al archivo CSV.
+
+    Returns:
+        dict: La entrada de la caché con el DataFrame, los tipos y su tamaño en memoria.
+    """
+    X = readCSV(path)
+    if not isinstance(X, pd.DataFrame):
+        raise ServiceError(400, str(X))
+
+    categorical, continuous, discreet = identifyVariables(X)
+    numerics = continuous + discreet
+    X[numerics] = X[numerics].apply(pd.to_numeric, errors='coerce')
+
+    return {"datos": X,
+            "tipos": {"categoricas": categorical, "continuas": continuous, "discretas": discreet},
+            "bytes": int(X.memory_usage(deep=True).sum()),
+            "resultados": {}}
+
+
+class ProfilingService:
+    """
+    Atiende las solicitudes HTTP usando la caché de conjuntos de datos y los hilos de trabajo.
+    """
+
+    def __init__(self, data_dir, cache_bytes, workers):
+        self.data_dir = os.path.realpath(data_dir)
+        self.cache = DatasetCache(cache_bytes)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        # matplotlib no es seguro entre hilos: los gráficos se generan en un único hilo propio,
+        # así las solicitudes de gráficos en espera no ocupan los hilos de los demás cálculos
+        self.plot_executor = ThreadPoolExecutor(max_workers=1)
+        self.inflight = {}  # Solicitudes en curso: clave -> futuro compartido
+        self.pool = {}  # Figuras reutilizables para los gráficos
+
+    async def run(self, key, function, *args, executor=None):
+        """
+        Ejecuta la función en un hilo de trabajo (del executor indicado o del general); si ya hay
+        una ejecución en curso con la misma clave, espera su resultado en lugar de repetirla.
+        """
+        future = self.inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(executor or self.executor, function, *args)
+            self.inflight[key] = future
+            future.add_done_callback(lambda f: self.inflight.pop(key, None))
+        # shield evita que la desconexión de un cliente cancele el resultado compartido
+        return await asyncio.shield(future)
+
+    def resolve(self, path):
+        if not path:
+            raise ServiceError(400, "Falta el parámetro 'path'.")
+        full = os.path.realpath(os.path.join(self.data_dir, path))
+        if os.path.commonpath([full, self.data_dir]) != self.data_dir:
+            raise ServiceError(400, "La ruta está fuera de la carpeta de datos.")
+        if not os.path.isfile(full):
+            raise ServiceError(404, f"No se encontró el archivo en la ruta '{path}'.")
+        return full
+
+    async def getDataset(self, path):
+        full = self.resolve(path)
+        info = os.stat(full)
+        # La fecha de modificación y el tamaño invalidan la caché si el archivo cambia
+        key = (full, info.st_mtime_ns, info.st_size)
+
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = await self.run(("cargar",) + key, loadDataset, full)
+            if self.cache.get(key) is None:
+                self.cache.put(key, entry)
+        return key, entry
+
+    async def getResult(self, path, name, function, *args, executor=None):
+        key, entry = await self.getDataset(path)
+        if name not in entry["resultados"]:
+            value, size = await self.run(key + name, computeSized, function, entry, *args, executor=executor)
+            # Todas las solicitudes que esperaron el mismo cálculo llegan aquí; se guarda una sola vez
+            if name not in entry["resultados"]:
+                self.cache.addResult(key, name, value, size)
+            return value
+        return entry["resultados"][name]
+
+    async def dispatch(self, route, params):
+        """
+        Devuelve el código, el tipo de contenido y el cuerpo de la respuesta para una ruta.
+        """
+        path = params.get("path")
+
+        if route == "/types":
+            key, entry = await self.getDataset(path)
+            return 200, "application/json", entry["tipos"]
+
+        if route == "/nulls":
+            value = await self.getResult(path, ("nulos",), computeNulls)
+            return 200, "application/json", value
+
+        if route == "/statistics":
+            value = await self.getResult(path, ("estadisticas",), computeStatistics)
+            return 200, "application/json", value
+
+        if route == "/outliers":
+            value = await self.getResult(path, ("atipicos",), computeOutliers)
+            return 200, "application/json", value
+
+        if route == "/association":
+            var1, var2 = params.get("var1"), params.get("var2")
+            key, entry = await self.getDataset(path)
+            checkVariables(entry, [var1, var2])
+            value = await self.getResult(path, ("asociacion", var1, var2), computeAssociation, var1, var2)
+            return 200, "application/json", value
+
+        if route == "/grouped":
+            target = params.get("target")
+            key, entry = await self.getDataset(path)
+            checkVariables(entry, [target])
+            if target not in entry["tipos"]["categoricas"]:
+                raise ServiceError(400, f"La variable '{target}' no es categórica.")
+            value = await self.getResult(path, ("agrupado", target), computeGrouped, target)
+            return 200, "application/json", value
+
+        if route == "/plot":
+            var, type, fmt = params.get("var"), params.get("type"), params.get("format", "png")
+            key, entry = await self.getDataset(path)
+            checkVariables(entry, [var])
+            if type not in getPlotSingleVariableTypes(getVarType(entry, var)):
+                raise ServiceError(400, f"Tipo de gráfico no válido para la variable '{var}': '{type}'.")
+            if fmt not in ("png", "svg"):
+                raise ServiceError(400, f"Formato no soportado: '{fmt}'. Use 'png' o 'svg'.")
+            value = await self.getResult(path, ("grafico", var, type, fmt), self.computePlot, var, type, fmt,
+                                         executor=self.plot_executor)
+            return 200, "image/png" if fmt == "png" else "image/svg+xml", value
+
+        raise ServiceError(404, f"Ruta desconocida: '{route}'.")
+
+    def computePlot(self, entry, var, type, fmt):
+        # Solo se ejecuta en plot_executor, por lo que las figuras de self.pool no se comparten entre hilos
+        return renderPlot(entry["datos"], var, type, self.pool, fmt)
+
+    async def handle(self, reader, writer):
+        try:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), REQUEST_TIMEOUT)
+                method, target, _ = head.split(b"\r\n", 1)[0].decode('latin-1').split(" ", 2)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                    asyncio.TimeoutError, ValueError):
+                raise ServiceError(400, "Solicitud HTTP no válida.")
+
+            if method != "GET":
+                raise ServiceError(405, "Solo se admiten solicitudes GET.")
+
+            url = urlsplit(target)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            status, content_type, body = await self.dispatch(url.path, params)
+
+        except ServiceError as e:
+            status, content_type, body = e.status, "application/json", {"error": e.message}
+        except Exception as e:
+            status, content_type, body = 500, "application/json", {"error": f"Se produjo un error inesperado: {e}"}
+
+        if not isinstance(body, bytes):
+            body = json.dumps(toJSON(body), ensure_ascii=False).encode('utf-8')
+            content_type += "; charset=utf-8"
+
+        writer.write((f"HTTP/1.1 {status} {STATUS[status]}\r\n"
+                      f"Content-Type: {content_type}\r\n"
+                      f"Content-Length: {len(body)}\r\n"
+                      f"Connection: close\r\n\r\n").encode('latin-1') + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass  # El cliente cerró la conexión antes de recibir la respuesta
+        finally:
+            writer.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.plot_executor.shutdown(wait=True)
+        closeFigures(self.pool)
+
+
+def getVarType(entry, var):
+    if var in entry["tipos"]["categoricas"]:
+        return "CAT"
+    return "CONT" if var in entry["tipos"]["continuas"] else "DISC"
+
+
+def checkVariables(entry, variables):
+    for var in variables:
+        if not var:
+            raise ServiceError(400, "Falta el nombre de una variable.")
+        if var not in entry["datos"].columns:
+            raise ServiceError(404, f"La variable '{var}' no está en el DataFrame.")
+
+
+def getNumerics(entry):
+    return entry["tipos"]["continuas"] + entry["tipos"]["discretas"]
+
+
+def computeNulls(entry):
+    return getNulls(entry["datos"])
+
+
+def computeStatistics(entry):
+    numerics = getNumerics(entry)
+    # getStatistics modifica las columnas que recibe; se le pasa una selección para no tocar el DataFrame compartido
+    statistics = getStatistics(entry["datos"][numerics], numerics)
+    return {col: dict(zip(["media", "mediana", "moda", "desviacion"], st)) for col, st in statistics.items()}
+
+
+def computeOutliers(entry):
+    outliers = getOutliers(entry["datos"], getNumerics(entry))
+    # Solo se envían las cantidades; los índices de fila pueden ser demasiados para una respuesta
+    return {
+        "variables": {col: {"iqr": o["iqr"][0], "zscore": o["zscore"][0], "mad": o["mad"][0],
+                            "validos": o["validos"], "tasa": o["tasa"]} for col, o in outliers.items()},
+        "ranking": [col for col, count, rate in rankOutliers(outliers)],
+    }
+
+
+def computeAssociation(entry, var1, var2):
+    return getAssociation(entry["datos"], var1, var2, entry["tipos"]["categoricas"])
+
+
+def computeGrouped(entry, target):
+    grouped = getGroupedStatistics(entry["datos"], target, getNumerics(entry))
+    # Las estadísticas para graficar (caja y densidad) no se envían
+    return {col: {label: {k: v for k, v in g.items() if k not in ("caja", "densidad")}
+                  for label, g in groups.items()} for col, groups in grouped.items()}
+
+
+async def serve(host, port, data_dir, cache_bytes, workers):
+    service = ProfilingService(data_dir, cache_bytes, workers)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"Servicio de perfilado en http://{host}:{port} (carpeta de datos: {service.data_dir})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servicio local de perfilado de datos.")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección de escucha.")
+    parser.add_argument("--port", type=int, default=8765, help="Puerto de escucha.")
+    parser.add_argument("--data-dir", default=".", help="Carpeta desde la cual se pueden leer archivos.")
+    parser.add_argument("--cache", type=parseMemory, default="1GB", help="Memoria máxima de la caché (p. ej. 1GB).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Cantidad de hilos de trabajo.")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.data_dir, args.cache, args.workers))
+    except KeyboardInterrupt:
+        print("\nServicio detenido.")
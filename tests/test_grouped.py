@@ -0,0 +1,60 @@
+'''
+    Pruebas de regresión de getGroupedStatistics.
+    Uso en consola (desde la raíz del proyecto):
+        python -m pytest tests
+        python tests/test_grouped.py
+'''
+
+import os  # Librería para manejo de rutas
+import sys  # Librería para manipulación del sistema
+import numpy as np  # Librería para operaciones numéricas
+import pandas as pd  # Librería para manipulación de datos
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import getGroupedStatistics  # Función a probar
+
+
+def test_small_wide_groups():
+    # Un grupo de 3 filas muy disperso frente a otro concentrado en una parte mínima del rango de la columna
+    X = pd.DataFrame({"objetivo": ["a"] * 3 + ["b"] * 500,
+                      "valor": [0.0, 5000.0, 10000.0] + list(np.random.default_rng(0).normal(10, 1, 500))})
+    grouped = getGroupedStatistics(X, "objetivo", ["valor"], bins=64, density=True)
+    for label, g in grouped["valor"].items():
+        density = g["densidad"]
+        assert len(density["coords"]) == len(density["vals"]), label
+        assert np.isfinite(density["vals"]).all(), label
+        # Cada grupo usa sus propios intervalos: la densidad tiene forma y su integral es ~1
+        assert len(density["coords"]) > 8, label
+        assert abs(density["vals"].sum() * (density["coords"][1] - density["coords"][0]) - 1) < 0.02, label
+        assert density["coords"][0] <= g["minimo"] and density["coords"][-1] >= g["maximo"], label
+
+
+def test_density_only_when_requested():
+    X = pd.DataFrame({"objetivo": ["a", "a", "b", "b"], "valor": [1.0, 2.0, 3.0, 4.0]})
+    grouped = getGroupedStatistics(X, "objetivo", ["valor"])
+    assert all(g["densidad"] is None for g in grouped["valor"].values())
+
+
+def test_all_null_column_reports_nulls():
+    X = pd.DataFrame({"objetivo": ["a", "a", "b"], "valor": [np.nan] * 3})
+    grouped = getGroupedStatistics(X, "objetivo", ["valor"])
+    assert grouped["valor"]["a"]["cantidad"] == 0 and grouped["valor"]["a"]["nulos"] == 2
+    assert grouped["valor"]["b"]["tasa_nulos"] == 1.0
+
+
+def test_no_numerics():
+    X = pd.DataFrame({"objetivo": ["a", "b"], "valor": [1.0, 2.0]})
+    assert getGroupedStatistics(X, "objetivo", [], density=True) == {}
+
+
+def test_all_null_target():
+    X = pd.DataFrame({"objetivo": [np.nan] * 3, "valor": [1.0, 2.0, 3.0]})
+    assert getGroupedStatistics(X, "objetivo", ["valor"], density=True) == {"valor": {}}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name} OK")
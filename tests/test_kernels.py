@@ -0,0 +1,78 @@
+'''
+    Pruebas de paridad de los núcleos de kernels.py: las versiones compiladas con numba (y sus
+    ciclos sin compilar) deben devolver lo mismo que las versiones de numpy.
+    Las pruebas compiladas se omiten si numba no está instalado.
+    Uso en consola (desde la raíz del proyecto):
+        python -m pytest tests
+        python tests/test_kernels.py
+'''
+
+import os  # Librería para manejo de rutas
+import sys  # Librería para manipulación del sistema
+import unittest  # Permite omitir pruebas (pytest reconoce unittest.SkipTest)
+import importlib.util  # Permite saber si numba está instalado
+import numpy as np  # Librería para operaciones numéricas
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kernels  # Núcleos a probar
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+def getArrays():
+    rng = np.random.default_rng(0)
+    nulls = rng.random(1000) < 0.2
+    return [rng.normal(size=1000),
+            np.where(nulls, np.nan, rng.integers(0, 5, 1000).astype(float)),
+            np.array([np.nan, np.nan]),
+            np.array([], dtype=float),
+            np.array([1.0, np.inf, -np.inf, np.nan]),
+            np.array([2.0, 2.0, 2.0])]
+
+
+def checkParity(candidate):
+    reference = kernels.NUMPY_KERNELS
+    for values in getArrays():
+        assert candidate["isIntegral"](values) == reference["isIntegral"](values)
+
+        expected = reference["getNullMoments"](values)
+        result = candidate["getNullMoments"](values)
+        assert tuple(result[:2]) == tuple(expected[:2])
+        assert np.allclose(result[2:], expected[2:], equal_nan=True)
+
+        assert np.array_equal(candidate["binValues"](values, -1.0, 0.5, 8),
+                              reference["binValues"](values, -1.0, 0.5, 8))
+
+        ordered = np.sort(values[~np.isnan(values)])
+        uniques, counts = candidate["getRuns"](ordered)
+        expected_uniques, expected_counts = reference["getRuns"](ordered)
+        assert np.array_equal(uniques, expected_uniques) and np.array_equal(counts, expected_counts)
+
+    # Los enteros conservan su tipo
+    ordered = np.sort(np.random.default_rng(1).integers(0, 7, 500))
+    uniques, counts = candidate["getRuns"](ordered)
+    assert uniques.dtype == ordered.dtype
+    assert np.array_equal(uniques, np.arange(7)) and counts.sum() == len(ordered)
+
+
+def test_loops_match_numpy():
+    # Los ciclos que compila numba, ejecutados como Python normal (los infinitos generan advertencias)
+    with np.errstate(invalid='ignore'):
+        checkParity(kernels.LOOP_KERNELS)
+
+
+@unittest.skipIf(not HAS_NUMBA, "numba no está instalado")
+def test_numba_matches_numpy():
+    with np.errstate(invalid='ignore'):
+        checkParity(kernels.compileKernels())
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            try:
+                test()
+                print(f"{name} OK")
+            except unittest.SkipTest as e:
+                print(f"{name} omitida: {e}")
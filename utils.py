@@ -1,179 +1,29 @@
-import pandas as pd  # Importa pandas para manipulación de datos
 import matplotlib.pyplot as plt  # Importa matplotlib para generación de gráficos
-import seaborn as sns  # Importa seaborn para gráficos estadísticos
-from tkinter import Tk, Label, Entry, Button, StringVar, messagebox, simpledialog
-import matplotlib.backends.backend_tkagg as tkagg
+from core import *  # Importa las funciones de perfilado desde core.py
 
+# seaborn y tkinter se importan dentro de las funciones que los usan, ya que su carga es lenta
+# y tkinter no está disponible en servidores sin interfaz gráfica
 
-def getOption(menu, options):
-    """
-    Muestra un menú y permite seleccionar entre las opciones disponibles, verificando que sea una opción válida.
-
-    Args:
-        menu (str): El menú a mostrar al usuario.
-        options (int): El número de opciones disponibles en el menú.
-
-    Returns:
-        int: La opción seleccionada por el usuario.
-    """
-    option = 0  # Inicializa la variable para almacenar la opción seleccionada
-
-    while (True):  # Bucle infinito hasta que se seleccione una opción válida
-        try:
-            # Solicita al usuario ingresar una opción
-            option = int(input(menu))
-            # Verifica si la opción ingresada es válida
-            if option <= 0 or option > options:
-                # Mensaje de error para opción no válida
-                print("Opción no válida")
-            else:
-                break  # Sale del bucle si la opción es válida
-        except:
-            # Mensaje de error para entrada no válida (no es un número entero)
-            print("Debe ingresar un número entero válido.\n")
-    return option  # Retorna la opción seleccionada
-
-
-def readCSV(path):
-    """
-    Recibe la ruta al archivo CSV que se desea analizar y valida que este sea válido para el análisis.
-
-    Args:
-        path (str): La ruta al archivo CSV.
-
-    Returns:
-        DataFrame o str: Retorna el DataFrame si la lectura es exitosa, de lo contrario, retorna un mensaje de error.
-    """
-    try:
-        # Intenta leer el archivo CSV en un DataFrame
-        X = pd.read_csv(path)
-
-        # Verifica si el DataFrame está vacío
-        if X.empty:
-            return "El archivo CSV está vacío."
-
-        return X  # Retorna el DataFrame si la lectura es exitosa
-
-    except FileNotFoundError:
-        # Retorna un mensaje de error si el archivo no se encuentra en la ruta especificada
-        return f"No se encontró el archivo en la ruta '{path}'."
-    except pd.errors.EmptyDataError:
-        # Retorna un mensaje de error si el archivo CSV está vacío
-        return "El archivo CSV está vacío."
-    except pd.errors.ParserError:
-        # Retorna un mensaje de error si ocurre un problema al analizar el archivo CSV
-        return "Error al analizar el archivo CSV."
-    except ValueError as e:
-        # Retorna el mensaje de error específico si ocurre un ValueError
-        return e
-    except Exception as e:
-        # Retorna un mensaje de error genérico para cualquier otra excepción
-        return f"Se produjo un error inesperado: {e}"
-
-
-def identifyVariables(dataset):
-    """
-    Identifica las variables del DataFrame X como:
-        - Categóricas
-        - Numéricas Continuas
-        - Numéricas Discretas
-
-    Args:
-        X (DataFrame): El DataFrame a analizar.
 
-    Returns:
-        list: Una lista de tres listas que contienen los nombres de las columnas categóricas, continuas y discretas.
+def annotateSample(ax, size, total, error, font_size=8):
     """
-    X = dataset.copy()
-    columnas_continuas = []  # Lista para almacenar las columnas numéricas continuas
-    columnas_discretas = []  # Lista para almacenar las columnas numéricas discretas
-    columnas_categoricas = []  # Lista para almacenar las columnas categóricas
-
-    # Itera sobre cada columna del DataFrame
-    for column in X.columns:
-        try:
-            # Intenta convertir la columna a valores numéricos
-            X[column] = pd.to_numeric(X[column], errors='coerce')
-        except:
-            # Si falla, se considera una columna categórica
-            columnas_categoricas.append(column)
-            continue
-
-        # Cuenta el número de valores únicos en la columna
-        num_unique = X[column].nunique()
-
-        if num_unique <= 2:
-            # Si hay 2 o menos valores únicos, se considera categórica
-            columnas_categoricas.append(column)
-        elif X[column].dropna().apply(lambda x: x.is_integer()).all():
-            # Si todos los valores son enteros, se considera discreta
-            columnas_discretas.append(column)
-        else:
-            # De lo contrario, se considera continua
-            columnas_continuas.append(column)
-
-    # Retorna las listas de columnas categóricas, continuas y discretas
-    return [columnas_categoricas, columnas_continuas, columnas_discretas]
-
-
-def getNulls(X):
-    
-    """
-    Para un DataFrame dado, identifica las variables en las que existan valores nulos y cuántos hay.
+    Muestra sobre el gráfico el tamaño de la muestra utilizada y su error estimado.
 
     Args:
-        X (DataFrame): El DataFrame a analizar.
-
-    Returns:
-        list: Una lista de tuplas de la forma (variable, cantidad_nulos, porcentaje_nulos).
+        ax (Axes): Los ejes del gráfico.
+        size (int): Cantidad de filas de la muestra.
+        total (int): Cantidad total de filas.
+        error (float): Error estándar estimado de la muestra.
+        font_size (int): Tamaño de la fuente.
     """
-    # Crea una lista de tuplas con el nombre de la columna, la cantidad de nulos y el porcentaje de nulos
-    nulls = [(col, X.isnull().sum()[col], X.isnull().sum()
-              [col] / X.shape[0]) for col in X.columns]
-    # Filtra las columnas que tienen al menos un valor nulo
-    # nulls = [n for n in nulls if n[1] > 0]
-    nulls = {col: [count, percentage] for col, count, percentage in nulls if count > 0}
-    return nulls  # Retorna el diccionario
+    if size >= total:
+        text = f"Datos completos: {total} filas"
+    else:
+        text = f"Muestra: {size} de {total} filas\nError estándar: ±{error:.3g}"
+    ax.text(0.99, 0.99, text, transform=ax.transAxes, ha='right', va='top',
+            fontsize=font_size - 2, bbox=dict(facecolor='white', alpha=0.7, edgecolor='none'))
 
 
-def getStatistics(X, numerics):
-    """
-    Muestra las estadísticas descriptivas para cada variable numérica en el dataframe X.
-    Devuelve un diccionario de la forma: 
-    { var: (media, mediana, moda, desviación estándar) }
-    para cada variable.
-
-    Args:
-        X (DataFrame): El DataFrame a analizar.
-        numerics (list): Lista de nombres de columnas numéricas.
-
-    Returns:
-        dict: Diccionario con estadísticas descriptivas para cada variable numérica.
-    """
-    statistics = {}  # Diccionario para almacenar las estadísticas
-
-    # Itera sobre cada columna numérica
-    for col in numerics:
-        # Intentar convertir la columna a valores numéricos, forzando a NaN los valores no convertibles
-        X[col] = pd.to_numeric(X[col], errors='coerce')
-        
-        # Elimina filas con NaN en la columna actual
-        X_cleaned = X[col].dropna()
-        
-        # Calcula estadísticas si la columna no está vacía
-        if not X_cleaned.empty:
-            mean = X_cleaned.mean()  # Calcula la media
-            median = X_cleaned.median()  # Calcula la mediana
-            mode = X_cleaned.mode().values[0] if not X_cleaned.mode().empty else None  # Calcula la moda
-            std = X_cleaned.std()  # Calcula la desviación estándar
-
-            # Almacena las estadísticas en el diccionario
-            statistics[col] = (mean, median, mode, std)
-        else:
-            statistics[col] = (None, None, None, None)
-
-    return statistics  # Retorna el diccionario con las estadísticas
-
 def getPlotSingleVariableTypes(varType):
     """
     Devuelve los tipos de gráficos disponibles para una única variable.
@@ -190,15 +40,20 @@ def getPlotSingleVariableTypes(varType):
         return ["Gráfico de Barras", "Histograma",
                  "Gráfico de Pareto", "Box Plot"]
         
-def getPlotByType(type, X, var, font_size):
+def getPlotByType(type, X, var, font_size, outliers=None, ax=None):
     """
     Devuelve el gráfico generado según el tipo indicado.
     Args:
         type (str): El tipo de gráfico a crear.
         X (dataFrame): DataFrame con los datos.
         var (str): Nombre de la columna en X para graficar.
+        outliers (dict): Resultado opcional de getOutliers con las estadísticas de caja ya calculadas.
+        ax (Axes): Ejes (ya limpios) sobre los cuales dibujar; si no se indican se crea una figura nueva.
     """
-    fig, ax = plt.subplots(figsize=(4,3))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(4,3))
+    else:
+        fig = ax.figure
 
     if type == "Gráfico de Barras":
         frequency = X[var].value_counts()
@@ -218,7 +73,8 @@ def getPlotByType(type, X, var, font_size):
         frequency = X[var].value_counts()
         frequency = frequency.sort_values(ascending=False)
         porcentaje_acumulado = frequency.cumsum() / frequency.sum() * 100
-        fig, ax1 = plt.subplots(figsize=(4,3))
+        # Dibuja sobre los mismos ejes para no dejar abierta una segunda figura
+        ax1 = ax
         ax1.bar(frequency.index.astype(str), frequency,
                 color='skyblue', edgecolor='black')
         ax1.set_xlabel(var)
@@ -229,7 +85,7 @@ def getPlotByType(type, X, var, font_size):
                  color='red', marker='o', linestyle='--')
         ax2.set_ylabel('Porcentaje Acumulado (%)', color='red')
         ax2.tick_params(axis='y', labelcolor='red')
-        plt.title(f'Gráfico de Pareto de la variable {var}')
+        ax1.set_title(f'Gráfico de Pareto de la variable {var}')
         ax1.title.set_fontsize(font_size)
         ax1.xaxis.label.set_fontsize(font_size)
         ax1.yaxis.label.set_fontsize(font_size)
@@ -240,7 +96,11 @@ def getPlotByType(type, X, var, font_size):
         ax2.tick_params(axis='both', which='major', labelsize=font_size)
 
     elif type == "Box Plot":
-        ax.boxplot(X[var].dropna(), vert=False, patch_artist=True,
+        # Usa las estadísticas de caja precalculadas en lugar de recalcularlas en matplotlib
+        if outliers is None or var not in outliers:
+            outliers = getOutliers(X, [var])
+        box = outliers[var]["caja"]
+        ax.bxp([box] if box else [], orientation='horizontal', patch_artist=True,
                     boxprops=dict(facecolor='skyblue', color='black'),
                     whiskerprops=dict(color='black'),
                     capprops=dict(color='black'),
@@ -255,6 +115,7 @@ def getPlotByType(type, X, var, font_size):
         ax.set_title(f'Gráfico de Torta de la variable {var}')
 
     elif type == "Gráfico de Densidad":
+        import seaborn as sns  # Importa seaborn para gráficos estadísticos
         sns.kdeplot(X[var].dropna(), fill=True, color='skyblue', ax=ax)
         ax.set_title(f'Gráfico de Densidad de la variable {var}')
         ax.set_xlabel(var)
@@ -274,6 +135,7 @@ def getPlotSingleVariable(X, var, categorical=False, continuous=False, discrete=
         continuous (bool): Indica si la variable es continua.
         discrete (bool): Indica si la variable es discreta.
     """
+    from tkinter import messagebox, simpledialog  # Cuadros de diálogo de la interfaz gráfica
 
     # Define los tipos de gráficos disponibles según el tipo de variable
     if categorical:
@@ -335,7 +197,8 @@ def getPlotSingleVariable(X, var, categorical=False, continuous=False, discrete=
         plt.title(f'Gráfico de Pareto de la variable {var}')
 
     elif chosen == "Box Plot":
-        plt.boxplot(X[var].dropna(), vert=False, patch_artist=True,
+        box = getOutliers(X, [var])[var]["caja"]
+        plt.gca().bxp([box] if box else [], orientation='horizontal', patch_artist=True,
                     boxprops=dict(facecolor='skyblue', color='black'),
                     whiskerprops=dict(color='black'),
                     capprops=dict(color='black'),
@@ -350,6 +213,7 @@ def getPlotSingleVariable(X, var, categorical=False, continuous=False, discrete=
         plt.title(f'Gráfico de Torta de la variable {var}')
 
     elif chosen == "Gráfico de Densidad":
+        import seaborn as sns  # Importa seaborn para gráficos estadísticos
         sns.kdeplot(X[var].dropna(), fill=True, color='skyblue')
         plt.title(f'Gráfico de Densidad de la variable {var}')
         plt.xlabel(var)
@@ -358,7 +222,50 @@ def getPlotSingleVariable(X, var, categorical=False, continuous=False, discrete=
     plt.show()
 
 
-def getPlotTwoVariables(X, var1, var2, categorical=None, continuous=None, discreet=None):
+def getGroupedPlot(type, X, cat, num, ax, vert=True, grouped=None):
+    """
+    Dibuja un gráfico de cajas o de violín de una variable numérica por cada categoría de otra,
+    a partir de los resúmenes por grupo de getGroupedStatistics (sin volver a recorrer las filas).
+
+    Args:
+        type (str): El tipo de gráfico (Gráfico de Cajas | Gráfico de Violin).
+        X (DataFrame): El DataFrame con los datos.
+        cat (str): Nombre de la variable categórica.
+        num (str): Nombre de la variable numérica.
+        ax (Axes): Ejes sobre los cuales dibujar.
+        vert (bool): Si es True, las categorías van en el eje X.
+        grouped (dict): Resúmenes opcionales de la forma { objetivo: resultado de getGroupedStatistics }.
+    """
+    violin = type == "Gráfico de Violin"
+    summaries = None
+    if grouped is not None and cat in grouped and num in grouped[cat]:
+        summaries = grouped[cat][num]
+        # Los resúmenes precalculados no incluyen la densidad si no se pidió
+        if violin and any(s["caja"] is not None and s["densidad"] is None for s in summaries.values()):
+            summaries = None
+    if summaries is None:
+        summaries = getGroupedStatistics(X, cat, [num], density=violin)[num]
+
+    # Omite las categorías sin valores numéricos
+    summaries = [s for s in summaries.values() if s["caja"] is not None]
+    positions = list(range(1, len(summaries) + 1))
+    labels = [str(s["caja"]["label"]) for s in summaries]
+    orientation = 'vertical' if vert else 'horizontal'
+
+    if violin:
+        ax.violin([s["densidad"] for s in summaries], positions, orientation=orientation, showmedians=True)
+    else:
+        ax.bxp([s["caja"] for s in summaries], positions, orientation=orientation, patch_artist=True,
+               boxprops=dict(facecolor='skyblue'),
+               medianprops=dict(color='red'))
+
+    if vert:
+        ax.set_xticks(positions, labels)
+    else:
+        ax.set_yticks(positions, labels)
+
+
+def getPlotTwoVariables(X, var1, var2, categorical=None, continuous=None, discreet=None, grouped=None):
     """
     Permite seleccionar y mostrar el gráfico apropiado según el tipo de variables.
     Versión para dos variables.
@@ -370,7 +277,10 @@ def getPlotTwoVariables(X, var1, var2, categorical=None, continuous=None, discre
         categorical (list): Lista de nombres de columnas categóricas.
         continuous (list): Lista de nombres de columnas continuas.
         discreet (list): Lista de nombres de columnas discretas.
+        grouped (dict): Resúmenes por grupo opcionales de la forma { objetivo: resultado de getGroupedStatistics }.
     """
+    import seaborn as sns  # Importa seaborn para gráficos estadísticos
+    from tkinter import Tk, Label, Entry, Button, StringVar, messagebox, simpledialog
     
     plt.close('all')
     
@@ -467,13 +377,16 @@ def getPlotTwoVariables(X, var1, var2, categorical=None, continuous=None, discre
             ax.set_ylabel(var_y)
 
         elif chosen == "Gráfico de Cajas":
-            sns.boxplot(x=X[var_x], y=X[var_y], ax=ax)
+            # Las categorías van en el eje de la variable categórica elegida
+            cat, num = (var_x, var_y) if var_x in categorical else (var_y, var_x)
+            getGroupedPlot(chosen, X, cat, num, ax, cat == var_x, grouped)
             ax.set_title(f'Gráfico de Cajas entre {var_x} y {var_y}')
             ax.set_xlabel(var_x)
             ax.set_ylabel(var_y)
 
         elif chosen == "Gráfico de Violin":
-            sns.violinplot(x=X[var_x], y=X[var_y], ax=ax)
+            cat, num = (var_x, var_y) if var_x in categorical else (var_y, var_x)
+            getGroupedPlot(chosen, X, cat, num, ax, cat == var_x, grouped)
             ax.set_title(f'Gráfico de Violin entre {var_x} y {var_y}')
             ax.set_xlabel(var_x)
             ax.set_ylabel(var_y)